@@ -1,5 +1,8 @@
 """Configuration management for Odoo MCP Server."""
 
+from collections.abc import Iterable
+from collections.abc import Set as AbstractSet
+
 from pydantic_settings import BaseSettings
 
 # =============================================================================
@@ -32,40 +35,44 @@ OAUTH_SCOPES = {
     "odoo.documents.write": "Upload identity documents",
 }
 
-# Scope requirements for each tool
+# Scope requirements for each tool (any one scope is sufficient)
 TOOL_SCOPE_REQUIREMENTS = {
     # Profile tools (Employee Self-Service)
-    "get_my_profile": ["odoo.hr.profile", "odoo.read"],
-    "get_my_manager": ["odoo.hr.profile", "odoo.read"],
-    "get_my_team": ["odoo.hr.team", "odoo.read"],
-    "find_colleague": ["odoo.hr.directory", "odoo.read"],
-    "get_direct_reports": ["odoo.hr.team", "odoo.read"],
-    "update_my_contact": ["odoo.hr.profile.write", "odoo.write"],
+    "get_my_profile": frozenset({"odoo.hr.profile", "odoo.read"}),
+    "get_my_manager": frozenset({"odoo.hr.profile", "odoo.read"}),
+    "get_my_team": frozenset({"odoo.hr.team", "odoo.read"}),
+    "find_colleague": frozenset({"odoo.hr.directory", "odoo.read"}),
+    "get_direct_reports": frozenset({"odoo.hr.team", "odoo.read"}),
+    "update_my_contact": frozenset({"odoo.hr.profile.write", "odoo.write"}),
 
     # Leave tools (Employee Self-Service)
-    "get_my_leave_balance": ["odoo.leave.read", "odoo.read"],
-    "get_my_leave_requests": ["odoo.leave.read", "odoo.read"],
-    "request_leave": ["odoo.leave.write", "odoo.write"],
-    "cancel_leave_request": ["odoo.leave.write", "odoo.write"],
-    "get_public_holidays": ["odoo.leave.read", "odoo.read"],
+    "get_my_leave_balance": frozenset({"odoo.leave.read", "odoo.read"}),
+    "get_my_leave_requests": frozenset({"odoo.leave.read", "odoo.read"}),
+    "request_leave": frozenset({"odoo.leave.write", "odoo.write"}),
+    "cancel_leave_request": frozenset({"odoo.leave.write", "odoo.write"}),
+    "get_public_holidays": frozenset({"odoo.leave.read", "odoo.read"}),
 
     # Document tools (Employee Self-Service)
-    "get_my_documents": ["odoo.documents.read", "odoo.read"],
-    "get_document_categories": ["odoo.documents.read", "odoo.read"],
-    "upload_identity_document": ["odoo.documents.write", "odoo.write"],
-    "download_document": ["odoo.documents.read", "odoo.read"],
-    "get_document_details": ["odoo.documents.read", "odoo.read"],
+    "get_my_documents": frozenset({"odoo.documents.read", "odoo.read"}),
+    "get_document_categories": frozenset({"odoo.documents.read", "odoo.read"}),
+    "upload_identity_document": frozenset({"odoo.documents.write", "odoo.write"}),
+    "download_document": frozenset({"odoo.documents.read", "odoo.read"}),
+    "get_document_details": frozenset({"odoo.documents.read", "odoo.read"}),
 
     # Generic CRUD tools (Admin only - requires odoo.write for most operations)
-    "search_records": ["odoo.read"],
-    "get_record": ["odoo.read"],
-    "create_record": ["odoo.write"],
-    "update_record": ["odoo.write"],
-    "delete_record": ["odoo.write"],
-    "count_records": ["odoo.read"],
-    "list_models": ["odoo.read"],
+    "search_records": frozenset({"odoo.read"}),
+    "get_record": frozenset({"odoo.read"}),
+    "create_record": frozenset({"odoo.write"}),
+    "update_record": frozenset({"odoo.write"}),
+    "delete_record": frozenset({"odoo.write"}),
+    "count_records": frozenset({"odoo.read"}),
+    "read_group": frozenset({"odoo.read"}),
+    "list_models": frozenset({"odoo.read"}),
 }
 
+# Required scopes for tools without an explicit entry above
+DEFAULT_TOOL_SCOPES = frozenset({"odoo.read"})
+
 # =============================================================================
 # Rate Limiting Configuration
 # =============================================================================
@@ -92,18 +99,20 @@ UPLOAD_TOOLS = [
 ]
 
 
-def check_scope_access(required_scopes: list[str], granted_scopes: list[str]) -> bool:
+def check_scope_access(required_scopes: Iterable[str], granted_scopes: Iterable[str]) -> bool:
     """
     Check if any of the required scopes are in the granted scopes.
 
     Args:
-        required_scopes: List of scopes that would grant access (any one is sufficient)
-        granted_scopes: List of scopes the user has
+        required_scopes: Scopes that would grant access (any one is sufficient)
+        granted_scopes: Scopes the user has; pass a frozenset to skip conversion
 
     Returns:
         True if user has at least one required scope
     """
-    return any(scope in granted_scopes for scope in required_scopes)
+    if not isinstance(granted_scopes, AbstractSet):
+        granted_scopes = frozenset(granted_scopes)
+    return not granted_scopes.isdisjoint(required_scopes)
 
 
 class Settings(BaseSettings):
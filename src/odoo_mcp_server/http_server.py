@@ -14,10 +14,10 @@ from urllib.parse import urlencode
 import httpx
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, Response
 from pydantic import BaseModel
 
-from .config import OAUTH_SCOPES, TOOL_SCOPE_REQUIREMENTS, Settings, check_scope_access
+from .config import DEFAULT_TOOL_SCOPES, OAUTH_SCOPES, TOOL_SCOPE_REQUIREMENTS, Settings, check_scope_access
 from .oauth.resource_server import (
     OAuthResourceServer,
     extract_user_context,
@@ -25,7 +25,7 @@ from .oauth.resource_server import (
 from .oauth.user_mapping import EmployeeNotFoundError, get_employee_for_user
 from .odoo.client import OdooClient
 from .resources import read_resource, register_resources
-from .tools import execute_tool, register_tools
+from .tools import execute_tool, register_tools, structured_content
 from .tools.employee import EMPLOYEE_TOOLS, execute_employee_tool
 
 logger = logging.getLogger(__name__)
@@ -61,6 +61,7 @@ def _get_advertised_scopes() -> list[str]:
 
 
 # Initialize resource server at module level (so it's available even without lifespan)
+# For Google OAuth: audience is client_id; for custom OAuth: audience is resource_identifier
 resource_server = OAuthResourceServer(
     resource=settings.oauth_resource_identifier,
     authorization_servers=[settings.oauth_authorization_server],
@@ -72,7 +73,7 @@ resource_server = OAuthResourceServer(
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
-    global odoo_client, resource_server
+    global odoo_client
 
     # Initialize Odoo client
     logger.info(f"Initializing Odoo client: {settings.odoo_url} (DB: {settings.odoo_db}, User: {settings.odoo_username or 'admin'})")
@@ -84,14 +85,8 @@ async def lifespan(app: FastAPI):
         password=settings.odoo_password,
     )
 
-    # Initialize OAuth resource server
-    # For Google OAuth: audience is client_id; for custom OAuth: audience is resource_identifier
-    resource_server = OAuthResourceServer(
-        resource=settings.oauth_resource_identifier,
-        authorization_servers=[settings.oauth_authorization_server],
-        audience=_get_oauth_audience(),
-        scopes_supported=_get_advertised_scopes(),
-    )
+    # The module-level resource server is reused rather than rebuilt here, so its
+    # token validator (and cached signing keys) lives for the whole process
 
     logger.info(f"OAuth provider: {settings.oauth_provider}")
     logger.info(f"OAuth issuer: {settings.oauth_issuer}")
@@ -224,9 +219,10 @@ async def oauth_middleware(request: Request, call_next):
             "sub": "dev-user",
             "email": dev_email,
             "employee_id": None,
-            "scopes": list(OAUTH_SCOPES.keys()),
+            "scopes": frozenset(OAUTH_SCOPES),
             "claims": {},
         }
+        request.state.scopes = request.state.user["scopes"]
         return await call_next(request)
 
     # Validate token
@@ -234,7 +230,9 @@ async def oauth_middleware(request: Request, call_next):
     if resource_server:
         try:
             claims = await resource_server.validate_token_async(token)
-            request.state.user = extract_user_context(claims)
+            user = extract_user_context(claims)
+            request.state.scopes = user["scopes"]
+            request.state.user = user
             return await call_next(request)
         except Exception as e:
             logger.warning(f"Token validation failed: {type(e).__name__}: {e}")
@@ -269,12 +267,18 @@ async def root():
 
 
 @app.get("/.well-known/oauth-protected-resource")
-async def oauth_protected_resource_metadata():
+async def oauth_protected_resource_metadata(request: Request):
     """RFC 9728 Protected Resource Metadata endpoint."""
     if not resource_server:
         raise HTTPException(status_code=503, detail="OAuth not configured")
 
-    return resource_server.metadata.to_dict()
+    etag = resource_server.metadata_etag
+    headers = {"ETag": etag}
+    if_none_match = request.headers.get("If-None-Match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+
+    return Response(resource_server.metadata_json, media_type="application/json", headers=headers)
 
 
 @app.get("/authorize")
@@ -483,7 +487,7 @@ async def mcp_sse_endpoint(request: Request):
 
 
 @app.post("/mcp")
-async def mcp_endpoint(request: Request, mcp_request: MCPRequest):
+async def mcp_endpoint(request: Request, mcp_request: MCPRequest | list[MCPRequest]):
     """
     MCP JSON-RPC endpoint.
 
@@ -492,11 +496,31 @@ async def mcp_endpoint(request: Request, mcp_request: MCPRequest):
     - tools/call: Execute a tool
     - resources/list: List available resources
     - resources/read: Read a resource
+
+    Accepts a JSON-RPC batch (array of requests); batch members are handled
+    in order and answered with an array of responses. Notifications (members
+    without an id) are handled but get no response, as JSON-RPC 2.0 requires.
     """
     user = getattr(request.state, "user", None)
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
+    if isinstance(mcp_request, list):
+        if not mcp_request:
+            return MCPResponse(error={"code": -32600, "message": "Invalid Request: empty batch"})
+        responses = []
+        for item in mcp_request:
+            response = await handle_mcp_request(item, user)
+            if "id" in item.model_fields_set:
+                responses.append(response)
+        # A batch of only notifications is answered with no body at all
+        return responses or Response(status_code=202)
+
+    return await handle_mcp_request(mcp_request, user)
+
+
+async def handle_mcp_request(mcp_request: MCPRequest, user: dict) -> MCPResponse:
+    """Dispatch a single MCP JSON-RPC request."""
     method = mcp_request.method
     params = mcp_request.params or {}
 
@@ -551,12 +575,12 @@ async def mcp_endpoint(request: Request, mcp_request: MCPRequest):
 async def handle_tools_list(user: dict) -> dict:
     """Handle tools/list MCP method."""
     all_tools = register_tools()
-    user_scopes = user.get("scopes", [])
+    user_scopes = frozenset(user.get("scopes", ()))
 
     # Filter tools based on user's scopes
     accessible_tools = []
     for tool in all_tools:
-        required_scopes = TOOL_SCOPE_REQUIREMENTS.get(tool.name, ["odoo.read"])
+        required_scopes = TOOL_SCOPE_REQUIREMENTS.get(tool.name, DEFAULT_TOOL_SCOPES)
         if check_scope_access(required_scopes, user_scopes):
             accessible_tools.append({
                 "name": tool.name,
@@ -576,8 +600,8 @@ async def handle_tools_call(params: dict, user: dict) -> dict:
         raise HTTPException(status_code=400, detail="Missing tool name")
 
     # Check scope access
-    user_scopes = user.get("scopes", [])
-    required_scopes = TOOL_SCOPE_REQUIREMENTS.get(tool_name, ["odoo.read"])
+    user_scopes = user.get("scopes", frozenset())
+    required_scopes = TOOL_SCOPE_REQUIREMENTS.get(tool_name, DEFAULT_TOOL_SCOPES)
 
     if not check_scope_access(required_scopes, user_scopes):
         logger.warning(f"Insufficient scope for tool {tool_name}. Required: {required_scopes}, Granted: {user_scopes}")
@@ -628,9 +652,13 @@ async def handle_tools_call(params: dict, user: dict) -> dict:
             # Execute generic tool (CRUD - only for admin users with odoo.write scope)
             result = await execute_tool(tool_name, arguments, odoo_client)
 
-        return {
+        response: dict[str, Any] = {
             "content": [{"type": "text", "text": r.text} for r in result],
         }
+        structured = structured_content(result)
+        if structured is not None:
+            response["structuredContent"] = structured
+        return response
     except HTTPException:
         raise
     except Exception as e:
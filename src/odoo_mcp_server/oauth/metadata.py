@@ -6,6 +6,8 @@ Implements the Protected Resource Metadata endpoint for OAuth 2.1 resource serve
 
 from dataclasses import dataclass, field
 
+import orjson
+
 
 @dataclass
 class ProtectedResourceMetadata:
@@ -63,5 +65,8 @@ class ProtectedResourceMetadata:
 
     def to_json(self) -> str:
         """Serialize metadata to JSON string."""
-        import json
-        return json.dumps(self.to_dict(), indent=2)
+        return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode()
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize metadata to compact JSON bytes for the HTTP response body."""
+        return orjson.dumps(self.to_dict())
@@ -4,7 +4,9 @@ OAuth 2.1 Resource Server Implementation
 Provides FastAPI middleware for OAuth token validation and user context extraction.
 """
 
+import hashlib
 import logging
+import sys
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
@@ -13,11 +15,33 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
 
+from ..config import OAUTH_SCOPES
 from .metadata import ProtectedResourceMetadata
 from .token_validator import TokenValidationError, TokenValidator
 
 logger = logging.getLogger(__name__)
 
+# Canonical (interned) scope strings, so scope sets built from claims share
+# string objects with the scope requirements they are checked against
+_KNOWN_SCOPES = {scope: sys.intern(scope) for scope in OAUTH_SCOPES}
+
+# Employee self-service scopes for verified Google users
+_GOOGLE_DEFAULT_SCOPES = frozenset(
+    _KNOWN_SCOPES[scope]
+    for scope in (
+        "odoo.hr.profile",
+        "odoo.hr.team",
+        "odoo.hr.directory",
+        "odoo.leave.read",
+        "odoo.leave.write",
+        "odoo.documents.read",
+        "odoo.read",
+    )
+)
+
+# Additional scopes for @keboola.com domain (internal users)
+_GOOGLE_INTERNAL_SCOPES = frozenset(_KNOWN_SCOPES[scope] for scope in ("odoo.documents.write", "odoo.write"))
+
 
 def extract_user_context(claims: dict[str, Any]) -> dict[str, Any]:
     """
@@ -30,16 +54,16 @@ def extract_user_context(claims: dict[str, Any]) -> dict[str, Any]:
         User context dictionary with:
         - email: User's email address
         - employee_id: Odoo employee ID (if present)
-        - scopes: List of granted scopes
+        - scopes: Frozenset of granted scopes
         - sub: Subject identifier
 
     Note:
         Google ID tokens don't include a 'scope' claim. For Google OAuth,
         we grant default scopes based on email verification and domain.
     """
-    # Extract scopes (space-separated string to list)
+    # Extract scopes (space-separated string to frozenset)
     scope_string = claims.get("scope", "")
-    scopes = scope_string.split() if scope_string else []
+    scopes = frozenset(_KNOWN_SCOPES.get(scope, scope) for scope in scope_string.split())
 
     # Check if this is a Google token
     iss = claims.get("iss", "")
@@ -54,33 +78,14 @@ def extract_user_context(claims: dict[str, Any]) -> dict[str, Any]:
         email_verified = claims.get("email_verified", False)
 
         if email_verified and email:
-            # Grant default employee self-service scopes for verified Google users
-            default_scopes = [
-                "odoo.hr.profile",
-                "odoo.hr.team",
-                "odoo.hr.directory",
-                "odoo.leave.read",
-                "odoo.leave.write",
-                "odoo.documents.read",
-                "odoo.read",
-            ]
-
             # Add to existing scopes (preserving openid, etc.)
-            for scope in default_scopes:
-                if scope not in scopes:
-                    scopes.append(scope)
+            scopes |= _GOOGLE_DEFAULT_SCOPES
 
             logger.info(f"Google OAuth: granted default scopes for {email}")
 
             # Grant additional scopes for @keboola.com domain (internal users)
             if email.endswith("@keboola.com"):
-                admin_scopes = [
-                    "odoo.documents.write",
-                    "odoo.write",
-                ]
-                for scope in admin_scopes:
-                    if scope not in scopes:
-                        scopes.append(scope)
+                scopes |= _GOOGLE_INTERNAL_SCOPES
                 logger.info(f"Google OAuth: granted extended scopes for internal user {email}")
 
     return {
@@ -108,6 +113,8 @@ class OAuthResourceServer:
     # Internal components
     _validator: TokenValidator | None = field(default=None, repr=False)
     _metadata: ProtectedResourceMetadata | None = field(default=None, repr=False)
+    _metadata_json: bytes = field(default=b"", repr=False)
+    _metadata_etag: str = field(default="", repr=False)
 
     def __post_init__(self):
         """Initialize internal components."""
@@ -122,6 +129,9 @@ class OAuthResourceServer:
             authorization_servers=self.authorization_servers,
             scopes_supported=self.scopes_supported,
         )
+        # Metadata is static per server: serialize it once and serve the bytes
+        self._metadata_json = self._metadata.to_json_bytes()
+        self._metadata_etag = f'"{hashlib.sha256(self._metadata_json).hexdigest()}"'
 
     @property
     def metadata(self) -> ProtectedResourceMetadata:
@@ -130,6 +140,16 @@ class OAuthResourceServer:
             raise RuntimeError("Metadata not initialized")
         return self._metadata
 
+    @property
+    def metadata_json(self) -> bytes:
+        """Get protected resource metadata as pre-serialized JSON bytes."""
+        return self._metadata_json
+
+    @property
+    def metadata_etag(self) -> str:
+        """Get the strong ETag (quoted SHA-256) of metadata_json."""
+        return self._metadata_etag
+
     @property
     def validator(self) -> TokenValidator:
         """Get token validator."""
@@ -230,9 +250,10 @@ class OAuthMiddleware(BaseHTTPMiddleware):
             request.state.user = {
                 "sub": "dev-user",
                 "email": "dev@example.com",
-                "scopes": ["openid", "odoo.read", "odoo.write"],
+                "scopes": frozenset({"openid", "odoo.read", "odoo.write"}),
                 "claims": {},
             }
+            request.state.scopes = request.state.user["scopes"]
             return await call_next(request)
 
         # Validate token
@@ -241,7 +262,9 @@ class OAuthMiddleware(BaseHTTPMiddleware):
 
         try:
             claims = await self.resource_server.validate_token_async(token)
-            request.state.user = extract_user_context(claims)
+            user = extract_user_context(claims)
+            request.state.scopes = user["scopes"]
+            request.state.user = user
             return await call_next(request)
         except TokenValidationError as e:
             logger.warning(f"Token validation failed: {e}")
@@ -267,8 +290,8 @@ def require_scopes(*required_scopes: str):
         if not user:
             raise HTTPException(status_code=401, detail="Not authenticated")
 
-        user_scopes = user.get("scopes", [])
-        has_scope = any(scope in user_scopes for scope in required_scopes)
+        user_scopes = getattr(request.state, "scopes", None) or frozenset(user.get("scopes", ()))
+        has_scope = not user_scopes.isdisjoint(required_scopes)
 
         if not has_scope:
             raise HTTPException(
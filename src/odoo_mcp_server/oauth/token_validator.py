@@ -5,30 +5,45 @@ Validates access tokens issued by the authorization server.
 
 Performance optimizations:
 - Global PyJWKClient singleton with built-in caching
-- Token validation result cache (TTL-based)
+- Parsed signing keys cached per validator by kid (TTL + background refresh)
+- Token validation result cache (TTL-based, LRU-bounded)
 - Async HTTP client with connection reuse
 """
 
+import asyncio
+import base64
 import hashlib
 import logging
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any
 
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
 # Global caches for performance
 _jwks_clients: dict[str, Any] = {}  # uri -> PyJWKClient
-_token_cache: dict[str, tuple[dict, float]] = {}  # token_hash -> (claims, expiry)
+_token_cache: OrderedDict[bytes, tuple[dict, float]] = OrderedDict()  # token_hash -> (claims, expiry)
 _TOKEN_CACHE_TTL = 300  # 5 minutes
+_TOKEN_CACHE_MAX_SIZE = 1024  # Least recently used entries are evicted beyond this
 _httpx_client: httpx.AsyncClient | None = None
+_JWKS_MIN_REFRESH_INTERVAL = 60  # Seconds between forced refreshes on unknown kid
 
 
-def _get_token_hash(token: str) -> str:
-    """Hash token for cache key (avoid storing raw tokens)."""
-    return hashlib.sha256(token.encode()).hexdigest()[:32]
+def _get_httpx_client() -> httpx.AsyncClient:
+    """Return the shared async HTTP client, creating it on first use."""
+    global _httpx_client
+    if _httpx_client is None:
+        _httpx_client = httpx.AsyncClient(timeout=5.0)
+    return _httpx_client
+
+
+def _get_token_hash(token: str) -> bytes:
+    """Hash token for cache key (avoid storing raw tokens); 128 bits is plenty."""
+    return hashlib.sha256(token.encode()).digest()[:16]
 
 
 def _get_cached_claims(token: str) -> dict | None:
@@ -37,7 +52,8 @@ def _get_cached_claims(token: str) -> dict | None:
     if token_hash in _token_cache:
         claims, expiry = _token_cache[token_hash]
         if time.time() < expiry:
-            logger.debug(f"Token cache hit for hash {token_hash[:8]}...")
+            _token_cache.move_to_end(token_hash)
+            logger.debug(f"Token cache hit for hash {token_hash[:4].hex()}...")
             return claims
         else:
             del _token_cache[token_hash]
@@ -54,7 +70,10 @@ def _cache_claims(token: str, claims: dict):
     else:
         expiry = time.time() + _TOKEN_CACHE_TTL
     _token_cache[token_hash] = (claims, expiry)
-    logger.debug(f"Cached token claims for hash {token_hash[:8]}...")
+    _token_cache.move_to_end(token_hash)
+    if len(_token_cache) > _TOKEN_CACHE_MAX_SIZE:
+        _token_cache.popitem(last=False)
+    logger.debug(f"Cached token claims for hash {token_hash[:4].hex()}...")
 
 
 class TokenValidationError(Exception):
@@ -82,6 +101,22 @@ class InvalidAudienceError(TokenValidationError):
     pass
 
 
+def _decode_segment(segment: str, name: str) -> dict[str, Any]:
+    """Decode an unverified JWT segment (base64url JSON object)."""
+    try:
+        decoded = orjson.loads(base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+    except ValueError as e:
+        raise InvalidTokenError(f"Invalid token: malformed {name} ({e})")
+    if not isinstance(decoded, dict):
+        raise InvalidTokenError(f"Invalid token: {name} is not a JSON object")
+    return decoded
+
+
+def _peek_kid(header_segment: str) -> str | None:
+    """Read the kid from an unverified JWT header segment."""
+    return _decode_segment(header_segment, "header").get("kid")
+
+
 @dataclass
 class TokenValidator:
     """
@@ -99,12 +134,20 @@ class TokenValidator:
     jwks: dict = field(default_factory=dict)
     _jwks_cache_time: float = field(default=0.0, repr=False)
     _jwks_cache_ttl: int = 3600  # 1 hour
+    _signing_keys: dict[str, Any] = field(default_factory=dict, repr=False)  # kid -> public key
+    _jwks_lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+    _jwks_refresh_task: asyncio.Task | None = field(default=None, repr=False)
+    _audiences: frozenset[str] = field(init=False, default=frozenset(), repr=False)
     # Google OAuth specific
     is_google: bool = False
     authorized_party: str | None = None  # For Google: must match client_id
 
     def __post_init__(self):
         """Initialize JWKS URI from issuer if not provided."""
+        # Accepted audiences as a set, so an aud claim list is checked in one isdisjoint()
+        audiences = [self.audience] if isinstance(self.audience, str) else self.audience
+        self._audiences = frozenset(audiences)
+
         if not self.jwks_uri:
             # Google uses a different JWKS endpoint
             if self.issuer == "https://accounts.google.com":
@@ -113,27 +156,116 @@ class TokenValidator:
             else:
                 self.jwks_uri = f"{self.issuer.rstrip('/')}/.well-known/jwks.json"
 
-    async def fetch_jwks(self) -> dict:
+    def _has_audience(self, aud_claim: str | list[str] | None) -> bool:
+        """Return True if the aud claim (string or list) names an accepted audience."""
+        if not aud_claim:
+            return False
+        try:
+            return not self._audiences.isdisjoint((aud_claim,) if isinstance(aud_claim, str) else aud_claim)
+        except TypeError:  # Not a string or a list of strings
+            return False
+
+    def _precheck_claims(self, payload_segment: str) -> None:
+        """
+        Reject missing, expired, foreign-issuer or wrong-audience claims
+        before any key lookup or signature verification.
+
+        The claims are unverified here; jwt.decode() checks them again
+        together with the signature.
+        """
+        claims = _decode_segment(payload_segment, "payload")
+        for claim in ("exp", "iss", "aud"):
+            if claim not in claims:
+                raise InvalidTokenError(f'Invalid token: Token is missing the "{claim}" claim')
+
+        exp = claims["exp"]
+        if isinstance(exp, (int, float)) and exp <= time.time():
+            raise TokenExpiredError("Token has expired")
+        if claims["iss"] != self.issuer:
+            raise InvalidIssuerError(f"Invalid issuer, expected {self.issuer}")
+        if not self._has_audience(claims["aud"]):
+            raise InvalidAudienceError(f"Invalid audience, expected {self.audience}")
+
+    async def fetch_jwks(self, force: bool = False) -> dict:
         """
         Fetch JWKS from authorization server.
 
-        Caches the JWKS for _jwks_cache_ttl seconds.
+        Caches the JWKS for _jwks_cache_ttl seconds and parses each key
+        into a public key object once, indexed by kid.
         """
         now = time.time()
-        if self.jwks and (now - self._jwks_cache_time) < self._jwks_cache_ttl:
+        if not force and self.jwks and (now - self._jwks_cache_time) < self._jwks_cache_ttl:
             return self.jwks
 
         if not self.jwks_uri:
             raise TokenValidationError("JWKS URI not configured")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(self.jwks_uri)
-            response.raise_for_status()
-            self.jwks = response.json()
-            self._jwks_cache_time = now
+        response = await _get_httpx_client().get(self.jwks_uri)
+        response.raise_for_status()
+        self.jwks = orjson.loads(response.content)
+        self._jwks_cache_time = now
+        self._signing_keys = self._parse_signing_keys(self.jwks)
 
         return self.jwks
 
+    @staticmethod
+    def _parse_signing_keys(jwks: dict) -> dict[str, Any]:
+        """Build public key objects from a JWKS document, keyed by kid."""
+        try:
+            from jwt import PyJWK
+        except ImportError:
+            raise TokenValidationError(
+                "PyJWT library required for token validation"
+            )
+
+        keys = {}
+        for jwk in jwks.get("keys", []):
+            if jwk.get("use", "sig") != "sig" or "kid" not in jwk:
+                continue
+            try:
+                keys[jwk["kid"]] = PyJWK(jwk).key
+            except Exception as e:
+                logger.warning(f"Skipping unusable JWKS key {jwk.get('kid')}: {e}")
+        return keys
+
+    async def _refresh_jwks_in_background(self) -> None:
+        """Refresh JWKS without failing the request that noticed it was stale."""
+        try:
+            async with self._jwks_lock:
+                await self.fetch_jwks(force=True)
+        except Exception as e:
+            logger.warning(f"Background JWKS refresh failed: {e}")
+
+    async def _get_signing_key(self, kid: str | None) -> Any:
+        """
+        Return the cached public key for kid.
+
+        Stale keys are served while a background refresh runs; an unknown
+        kid triggers one synchronous refresh (at most every
+        _JWKS_MIN_REFRESH_INTERVAL seconds, so random kids cannot flood the
+        authorization server).
+        """
+        if kid is None:
+            raise InvalidTokenError("Token header has no kid")
+
+        key = self._signing_keys.get(kid)
+        if key is not None:
+            stale = time.time() - self._jwks_cache_time >= self._jwks_cache_ttl
+            if stale and (self._jwks_refresh_task is None or self._jwks_refresh_task.done()):
+                self._jwks_refresh_task = asyncio.create_task(self._refresh_jwks_in_background())
+            return key
+
+        async with self._jwks_lock:
+            if kid not in self._signing_keys:
+                recently_fetched = time.time() - self._jwks_cache_time < _JWKS_MIN_REFRESH_INTERVAL
+                if not (recently_fetched and self._signing_keys):
+                    await self.fetch_jwks(force=True)
+
+        key = self._signing_keys.get(kid)
+        if key is None:
+            raise InvalidTokenError(f"Unknown signing key: {kid}")
+        return key
+
     def validate(self, token: str) -> dict[str, Any]:
         """
         Validate a token synchronously.
@@ -176,11 +308,14 @@ class TokenValidator:
                 return claims
             raise InvalidTokenError("Invalid JWT format")
 
-        try:
-            # Ensure JWKS URI is configured
-            if not self.jwks_uri:
-                raise TokenValidationError("JWKS URI not configured")
+        # Cheap claim checks first: a bad token never costs a JWKS fetch or RSA verify
+        self._precheck_claims(parts[1])
+
+        # Ensure JWKS URI is configured
+        if not self.jwks_uri:
+            raise TokenValidationError("JWKS URI not configured")
 
+        try:
             # Get or create cached PyJWKClient for this JWKS URI
             global _jwks_clients
             if self.jwks_uri not in _jwks_clients:
@@ -191,13 +326,24 @@ class TokenValidator:
                 )
             jwks_client = _jwks_clients[self.jwks_uri]
             signing_key = jwks_client.get_signing_key_from_jwt(token)
+        except jwt.InvalidTokenError as e:
+            raise InvalidTokenError(f"Invalid token: {e}")
+        except Exception as e:
+            raise TokenValidationError(f"Token validation failed: {e}")
+
+        return self._verify(token, signing_key.key)
 
+    def _verify(self, token: str, key: Any) -> dict[str, Any]:
+        """Verify signature and claims with a resolved key, then cache the claims."""
+        import jwt
+
+        try:
             # Google ID tokens use client_id as audience
             if self.is_google:
                 # For Google: audience is the client_id
                 claims = jwt.decode(
                     token,
-                    signing_key.key,
+                    key,
                     algorithms=["RS256"],
                     issuer=self.issuer,
                     audience=self.audience,  # This is the Google client_id
@@ -221,14 +367,11 @@ class TokenValidator:
                 if not claims.get("email_verified", False):
                     email = claims.get("email")
                     logger.warning(f"Google token email not verified: {email}")
-
-                _cache_claims(token, claims)
-                return claims
             else:
                 # Standard OAuth 2.0 token validation
                 claims = jwt.decode(
                     token,
-                    signing_key.key,
+                    key,
                     algorithms=["RS256", "RS384", "RS512", "ES256", "ES384", "ES512"],
                     issuer=self.issuer,
                     audience=self.audience,
@@ -240,9 +383,8 @@ class TokenValidator:
                     }
                 )
 
-                _cache_claims(token, claims)
-                return claims
-
+        except TokenValidationError:
+            raise
         except jwt.ExpiredSignatureError:
             raise TokenExpiredError("Token has expired")
         except jwt.InvalidIssuerError:
@@ -254,6 +396,9 @@ class TokenValidator:
         except Exception as e:
             raise TokenValidationError(f"Token validation failed: {e}")
 
+        _cache_claims(token, claims)
+        return claims
+
     def _validate_google_access_token(self, token: str) -> dict[str, Any]:
         """
         Validate a Google opaque access token using tokeninfo endpoint (sync).
@@ -272,8 +417,6 @@ class TokenValidator:
         Raises:
             TokenValidationError: If token is invalid
         """
-        import httpx
-
         try:
             # Call Google's tokeninfo endpoint with connection reuse
             with httpx.Client(timeout=5.0) as client:
@@ -283,15 +426,15 @@ class TokenValidator:
                 )
 
             if response.status_code != 200:
-                error_data = response.json() if response.text else {}
+                error_data = orjson.loads(response.content) if response.content else {}
                 err_msg = error_data.get("error_description", "Unknown error")
                 raise InvalidTokenError(f"Google token validation failed: {err_msg}")
 
-            claims = response.json()
+            claims = orjson.loads(response.content)
 
             # Verify audience matches our client_id
             token_aud = claims.get("aud") or claims.get("azp")
-            if token_aud != self.audience:
+            if not self._has_audience(token_aud):
                 raise InvalidAudienceError(
                     f"Invalid audience: expected {self.audience}, got {token_aud}"
                 )
@@ -332,28 +475,22 @@ class TokenValidator:
         Raises:
             TokenValidationError: If token is invalid
         """
-        global _httpx_client
-
         try:
-            # Get or create shared async client
-            if _httpx_client is None:
-                _httpx_client = httpx.AsyncClient(timeout=5.0)
-
-            response = await _httpx_client.get(
+            response = await _get_httpx_client().get(
                 "https://www.googleapis.com/oauth2/v3/tokeninfo",
                 params={"access_token": token},
             )
 
             if response.status_code != 200:
-                error_data = response.json() if response.text else {}
+                error_data = orjson.loads(response.content) if response.content else {}
                 err_msg = error_data.get("error_description", "Unknown error")
                 raise InvalidTokenError(f"Google token validation failed: {err_msg}")
 
-            claims = response.json()
+            claims = orjson.loads(response.content)
 
             # Verify audience matches our client_id
             token_aud = claims.get("aud") or claims.get("azp")
-            if token_aud != self.audience:
+            if not self._has_audience(token_aud):
                 raise InvalidAudienceError(
                     f"Invalid audience: expected {self.audience}, got {token_aud}"
                 )
@@ -384,7 +521,8 @@ class TokenValidator:
         """
         Validate a token asynchronously.
 
-        Performance: Uses caching and async HTTP client for Google tokens.
+        Performance: Uses caching and async HTTP client for Google tokens;
+        JWTs are verified against signing keys cached by kid.
         """
         # Check cache first
         cached = _get_cached_claims(token)
@@ -398,16 +536,30 @@ class TokenValidator:
             _cache_claims(token, claims)
             return claims
 
-        # For JWT tokens, use sync validation (PyJWT is sync)
-        # The cache check above ensures we don't repeat validation
-        # Offload CPU-bound validation to executor to avoid blocking event loop
-        import asyncio
-        from functools import partial
-        
-        await self.fetch_jwks()
-        
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, partial(self.validate, token))
+        if len(parts) != 3:
+            raise InvalidTokenError("Invalid JWT format")
+
+        try:
+            import jwt  # noqa: F401 - fail early with a clear error
+        except ImportError:
+            raise TokenValidationError(
+                "PyJWT library required for token validation"
+            )
+
+        # Reject bad claims cheaply, resolve the key from the per-validator
+        # cache (no JWKS round-trip in steady state), then verify in-line:
+        # RSA/ECDSA verification of one token is far cheaper than an executor hop
+        kid = _peek_kid(parts[0])
+        self._precheck_claims(parts[1])
+
+        try:
+            key = await self._get_signing_key(kid)
+        except TokenValidationError:
+            raise
+        except Exception as e:
+            raise TokenValidationError(f"Token validation failed: {e}")
+
+        return self._verify(token, key)
 
     def get_claims(self, token: str) -> dict[str, Any]:
         """
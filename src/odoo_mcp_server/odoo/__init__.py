@@ -1,4 +1,4 @@
-"""Odoo XML-RPC client and utilities."""
+"""Odoo JSON-RPC client and utilities."""
 
 from .client import OdooClient
 from .exceptions import (
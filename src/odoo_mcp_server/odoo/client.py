@@ -1,18 +1,20 @@
 """
-Odoo XML-RPC Client
+Odoo JSON-RPC Client
 
 Handles communication with Odoo ERP instance.
 Includes async-safe operations and error handling.
 
-Security Note: XML-RPC is used to communicate with trusted internal Odoo servers only.
-The B411 bandit warning about XML vulnerabilities is acknowledged - we only connect
-to our own Odoo instances, not untrusted external sources.
+Calls go to Odoo's /jsonrpc endpoint over one pooled httpx.AsyncClient, so
+kept-alive connections are reused across requests instead of opening a new
+TCP/TLS connection per call.
 """
 import asyncio
-import xmlrpc.client  # nosec B411 - connecting to trusted internal Odoo server only
-from functools import partial
+import itertools
 from typing import Any
-from xmlrpc.client import Fault  # nosec B411
+from xmlrpc.client import Fault  # nosec B411 - only the Fault type, no XML parsing
+
+import httpx
+import orjson
 
 from .exceptions import (
     OdooAuthenticationError,
@@ -20,15 +22,40 @@ from .exceptions import (
     map_odoo_fault,
 )
 
+# Odoo exception class -> fault code used by its XML-RPC API (see exceptions.py)
+_JSONRPC_FAULT_CODES = {
+    "odoo.exceptions.UserError": 1,
+    "odoo.exceptions.ValidationError": 1,
+    "odoo.exceptions.MissingError": 2,
+    "odoo.exceptions.AccessDenied": 3,
+    "odoo.exceptions.AccessError": 4,
+}
+
+
+def _fault_from_jsonrpc_error(error: dict) -> Fault:
+    """
+    Translate a JSON-RPC error payload into the equivalent XML-RPC Fault.
+
+    Keeps map_odoo_fault() as the single place that maps Odoo errors to
+    OdooError subclasses, whichever transport reported them.
+    """
+    data = error.get("data") or {}
+    name = data.get("name", "")
+    message = data.get("message") or error.get("message", "")
+    fault_code = _JSONRPC_FAULT_CODES.get(name, error.get("code", 0))
+    if name:
+        message = f"{name.rsplit('.', 1)[-1]}: {message}"
+    return Fault(fault_code, message)
+
 
 class OdooClient:
     """
-    Async wrapper for Odoo XML-RPC API.
+    Async client for the Odoo JSON-RPC API.
 
     Thread/task-safe: Uses asyncio.Lock for UID caching to prevent
     race conditions in concurrent async operations.
 
-    Error Handling: All XML-RPC faults are mapped to typed exceptions
+    Error Handling: All Odoo faults are mapped to typed exceptions
     for clean error responses in MCP tools.
     """
 
@@ -47,36 +74,45 @@ class OdooClient:
         self.username = username
         self.password = password
 
-        self._common = xmlrpc.client.ServerProxy(
-            f"{self.url}/xmlrpc/2/common"
-        )
-        self._models = xmlrpc.client.ServerProxy(
-            f"{self.url}/xmlrpc/2/object"
+        self._endpoint = f"{self.url}/jsonrpc"
+        self._http = httpx.AsyncClient(
+            headers={"Content-Type": "application/json"},
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=64),
         )
+        self._request_ids = itertools.count(1)
         self._uid: int | None = None
 
         # Async lock for thread-safe UID caching (Feedback 4.3)
         self._uid_lock = asyncio.Lock()
 
-    async def _run_in_executor(self, func, *args) -> Any:
+    async def _jsonrpc_call(self, service: str, method: str, *args) -> Any:
         """
-        Run blocking XML-RPC call in executor.
+        Call a method of an Odoo RPC service ("common" or "object").
 
-        Wraps XML-RPC errors in typed exceptions.
+        Wraps JSON-RPC errors and transport failures in typed exceptions.
         """
-        loop = asyncio.get_running_loop()
+        body = orjson.dumps({
+            "jsonrpc": "2.0",
+            "method": "call",
+            "params": {"service": service, "method": method, "args": args},
+            "id": next(self._request_ids),
+        })
         try:
-            return await loop.run_in_executor(
-                None, partial(func, *args)
-            )
-        except Fault as e:
-            raise map_odoo_fault(e) from e
-        except (TimeoutError, ConnectionError, OSError) as e:
+            response = await self._http.post(self._endpoint, content=body)
+            response.raise_for_status()
+            payload = orjson.loads(response.content)
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
             raise map_connection_error(e) from e
 
+        if "error" in payload:
+            fault = _fault_from_jsonrpc_error(payload["error"])
+            raise map_odoo_fault(fault) from None
+        return payload.get("result")
+
     async def get_version(self) -> dict:
         """Get Odoo server version"""
-        return await self._run_in_executor(self._common.version)
+        return await self._jsonrpc_call("common", "version")
 
     async def authenticate(self) -> int:
         """
@@ -97,13 +133,13 @@ class OdooClient:
 
             if self.api_key:
                 # API key authentication
-                self._uid = await self._run_in_executor(
-                    self._common.authenticate,
+                self._uid = await self._jsonrpc_call(
+                    "common", "authenticate",
                     self.db, self.username or "admin", self.api_key, {}
                 )
             else:
-                self._uid = await self._run_in_executor(
-                    self._common.authenticate,
+                self._uid = await self._jsonrpc_call(
+                    "common", "authenticate",
                     self.db, self.username, self.password, {}
                 )
 
@@ -128,8 +164,9 @@ class OdooClient:
         # Decide what to use as password/key
         password_or_key = self.api_key or self.password
 
-        return await self._run_in_executor(
-            self._models.execute_kw,
+        return await self._jsonrpc_call(
+            "object",
+            "execute_kw",
             self.db,
             uid,
             password_or_key,
@@ -139,6 +176,23 @@ class OdooClient:
             kwargs
         )
 
+    async def search(
+        self,
+        model: str,
+        domain: list,
+        limit: int | None = None,
+        offset: int = 0,
+        order: str | None = None
+    ) -> list[int]:
+        """Search for record IDs only (no field read)"""
+        kwargs: dict[str, Any] = {"offset": offset}
+        if limit is not None:
+            kwargs["limit"] = limit
+        if order:
+            kwargs["order"] = order
+
+        return await self.execute(model, "search", domain, **kwargs)
+
     async def search_read(
         self,
         model: str,
@@ -183,6 +237,17 @@ class OdooClient:
         """Update records"""
         return await self.execute(model, "write", ids, values)
 
+    async def update_and_read(
+        self,
+        model: str,
+        ids: list[int],
+        values: dict,
+        fields: list[str] | None = None
+    ) -> list[dict]:
+        """Update records and return their persisted values"""
+        await self.write(model, ids, values)
+        return await self.read(model, ids, fields)
+
     async def unlink(self, model: str, ids: list[int]) -> bool:
         """Delete records"""
         return await self.execute(model, "unlink", ids)
@@ -191,6 +256,19 @@ class OdooClient:
         """Count matching records"""
         return await self.execute(model, "search_count", domain)
 
+    async def read_group(
+        self,
+        model: str,
+        domain: list,
+        fields: list[str],
+        groupby: list[str] | None = None,
+        lazy: bool = True
+    ) -> list[dict]:
+        """Aggregate records server-side (e.g. 'expected_revenue:sum')"""
+        return await self.execute(
+            model, "read_group", domain, fields, groupby or [], lazy=lazy
+        )
+
     async def fields_get(
         self,
         model: str,
@@ -204,5 +282,5 @@ class OdooClient:
         return await self.execute(model, "fields_get", **kwargs)
 
     async def close(self):
-        """Cleanup resources"""
-        pass  # XML-RPC is stateless
+        """Close the pooled HTTP connections"""
+        await self._http.aclose()
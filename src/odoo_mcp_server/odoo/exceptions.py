@@ -11,10 +11,14 @@ Error Code Reference (Odoo XML-RPC):
 - Fault 4: AccessError (permission denied)
 """
 
+import json
+import re
 import socket
 from typing import Any
 from xmlrpc.client import Fault  # nosec B411 - used for error handling with trusted Odoo server
 
+import httpx
+
 
 class OdooError(Exception):
     """Base exception for all Odoo-related errors."""
@@ -29,16 +33,8 @@ class OdooError(Exception):
 
     def to_mcp_response(self) -> dict:
         """Convert error to MCP-friendly JSON response."""
-        response = {
-            "error": {
-                "code": self.error_code,
-                "message": self.message,
-            }
-        }
-        # Add any additional details
-        for key, value in self.details.items():
-            response["error"][key] = value
-        return response
+        # One dict display; details (e.g. field, or error_code for unknown faults) override the defaults
+        return {"error": {"code": self.error_code, "message": self.message, **self.details}}
 
     def __str__(self) -> str:
         return f"[{self.error_code}] {self.message}"
@@ -98,11 +94,33 @@ class OdooServerError(OdooError):
     is_retryable = True
 
 
+# Odoo exception class named in the fault string -> OdooError subclass
+_FAULT_NAME_MAP: dict[str, type[OdooError]] = {
+    "AccessDenied": OdooAuthenticationError,
+    "AccessError": OdooPermissionError,
+    "MissingError": OdooRecordNotFoundError,
+    "UserError": OdooValidationError,
+    "ValidationError": OdooValidationError,
+}
+_FAULT_NAME_RE = re.compile(r"\b(" + "|".join(_FAULT_NAME_MAP) + r")\b")
+# "UserError: Message here" - one scan finds the first class-name prefix
+_FAULT_MESSAGE_RE = re.compile("(?:" + "|".join(_FAULT_NAME_MAP) + "):")
+
+# Fallback by XML-RPC fault code when the fault string names no known class
+_FAULT_CODE_MAP: dict[int, type[OdooError]] = {
+    1: OdooValidationError,
+    2: OdooRecordNotFoundError,
+    3: OdooAuthenticationError,
+    4: OdooPermissionError,
+}
+
+
 def map_odoo_fault(fault: Fault) -> OdooError:
     """
     Map XML-RPC Fault to appropriate OdooError subclass.
 
-    Odoo fault codes:
+    The Odoo exception class named in the fault string wins; otherwise
+    the fault code decides:
     - 1: UserError, ValidationError
     - 2: MissingError
     - 3: AccessDenied
@@ -120,18 +138,10 @@ def map_odoo_fault(fault: Fault) -> OdooError:
     # Extract meaningful message from fault string
     message = _extract_error_message(fault_string)
 
-    # Map by fault code
-    if fault_code == 3:
-        return OdooAuthenticationError(message, original_fault=fault_string)
-
-    if fault_code == 4 or "AccessError" in fault_string:
-        return OdooPermissionError(message, original_fault=fault_string)
-
-    if fault_code == 2 or "MissingError" in fault_string:
-        return OdooRecordNotFoundError(message, original_fault=fault_string)
-
-    if fault_code == 1 or "UserError" in fault_string or "ValidationError" in fault_string:
-        return OdooValidationError(message, original_fault=fault_string)
+    match = _FAULT_NAME_RE.search(fault_string)
+    error_class = _FAULT_NAME_MAP[match.group(1)] if match else _FAULT_CODE_MAP.get(fault_code)
+    if error_class is not None:
+        return error_class(message, original_fault=fault_string)
 
     # Unknown fault - return generic error with details
     return OdooError(
@@ -147,12 +157,25 @@ def map_connection_error(error: Exception) -> OdooError:
     Map connection/network errors to appropriate OdooError.
 
     Args:
-        error: Original exception (socket.timeout, ConnectionError, etc.)
+        error: Original exception (httpx.HTTPError, JSONDecodeError, socket.timeout, ConnectionError, etc.)
 
     Returns:
         Appropriate OdooError subclass
     """
-    if isinstance(error, socket.timeout):
+    if isinstance(error, httpx.HTTPStatusError):
+        return OdooServerError(
+            f"Odoo returned HTTP {error.response.status_code}",
+            original_error=str(error),
+        )
+
+    if isinstance(error, json.JSONDecodeError):
+        # e.g. an HTML login or maintenance page from a proxy, or a truncated body
+        return OdooServerError(
+            "Odoo returned a response that is not valid JSON",
+            original_error=str(error),
+        )
+
+    if isinstance(error, (socket.timeout, httpx.TimeoutException)):
         return OdooTimeoutError(
             f"Connection timed out: {error}",
             original_error=str(error),
@@ -164,7 +187,7 @@ def map_connection_error(error: Exception) -> OdooError:
             original_error=str(error),
         )
 
-    if isinstance(error, (ConnectionError, OSError)):
+    if isinstance(error, (ConnectionError, OSError, httpx.TransportError)):
         return OdooConnectionError(
             f"Network error: {error}",
             original_error=str(error),
@@ -193,11 +216,9 @@ def _extract_error_message(fault_string: str) -> str:
     # Handle common patterns
 
     # Pattern: "UserError: Message here"
-    for prefix in ["UserError:", "ValidationError:", "MissingError:", "AccessError:", "AccessDenied:"]:
-        if prefix in fault_string:
-            parts = fault_string.split(prefix, 1)
-            if len(parts) > 1:
-                return parts[1].strip().split("\n")[0].strip()
+    match = _FAULT_MESSAGE_RE.search(fault_string)
+    if match:
+        return fault_string[match.end():].strip().split("\n")[0].strip()
 
     # Pattern: Just return first line if multiline
     first_line = fault_string.split("\n")[0].strip()
@@ -22,7 +22,7 @@ from mcp.types import (
 from .config import Settings
 from .odoo.client import OdooClient
 from .resources import register_resources
-from .tools import register_tools
+from .tools import register_tools, structured_content
 
 logger = logging.getLogger(__name__)
 
@@ -58,12 +58,18 @@ async def list_tools() -> list[Tool]:
 
 
 @server.call_tool()
-async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-    """Execute a tool"""
+async def call_tool(
+    name: str, arguments: dict[str, Any]
+) -> list[TextContent] | tuple[list[TextContent], dict[str, Any]]:
+    """Execute a tool, returning structured content alongside the text"""
     from .tools import execute_tool
     if not odoo_client:
         raise RuntimeError("Odoo client not initialized")
-    return await execute_tool(name, arguments, odoo_client)
+    content = await execute_tool(name, arguments, odoo_client)
+    structured = structured_content(content)
+    if structured is None:
+        return content
+    return content, structured
 
 
 @server.list_resources()
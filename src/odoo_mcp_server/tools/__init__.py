@@ -1,5 +1,10 @@
 """MCP tools for Odoo operations."""
 
+import json
+from typing import Any
+
+from mcp.types import TextContent
+
 from .employee import EMPLOYEE_TOOLS, execute_employee_tool
 from .records import TOOLS as CRUD_TOOLS
 from .records import execute_tool as execute_crud_tool
@@ -12,6 +17,7 @@ __all__ = [
     "register_tools",
     "register_employee_tools",
     "execute_tool",
+    "structured_content",
 ]
 
 
@@ -43,3 +49,22 @@ async def execute_tool(name: str, arguments: dict, odoo_client):  # type: ignore
         return await execute_crud_tool(name, arguments, odoo_client)
 
     raise ValueError(f"Unknown tool: {name}")
+
+
+def structured_content(result: list[TextContent]) -> dict[str, Any] | None:
+    """
+    Build MCP structuredContent from a tool's JSON text result.
+
+    JSON objects are returned as-is; other JSON values are wrapped as
+    {"result": ...}, the MCP convention for non-object output. Returns
+    None when the result is not a single JSON text block.
+    """
+    if len(result) != 1 or not isinstance(result[0], TextContent):
+        return None
+
+    try:
+        value = json.loads(result[0].text)
+    except json.JSONDecodeError:
+        return None
+
+    return value if isinstance(value, dict) else {"result": value}
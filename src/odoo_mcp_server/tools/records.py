@@ -103,6 +103,11 @@ TOOLS = [
                 "values": {
                     "type": "object",
                     "description": "Field values to update"
+                },
+                "fields": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Fields to return from the updated record"
                 }
             },
             "required": ["model", "record_id", "values"]
@@ -145,6 +150,36 @@ TOOLS = [
             "required": ["model"]
         }
     ),
+    Tool(
+        name="read_group",
+        description="Aggregate records server-side, optionally grouped by fields",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "model": {
+                    "type": "string",
+                    "description": "Odoo model name"
+                },
+                "domain": {
+                    "type": "array",
+                    "description": "Search domain filters",
+                    "default": []
+                },
+                "fields": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Aggregates to compute (e.g., 'expected_revenue:sum')"
+                },
+                "groupby": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Fields to group by (empty for a single total)",
+                    "default": []
+                }
+            },
+            "required": ["model", "fields"]
+        }
+    ),
     Tool(
         name="list_models",
         description="List available Odoo models",
@@ -191,6 +226,16 @@ async def execute_tool(
         return [TextContent(type="text", text=json.dumps({"id": record_id}))]
 
     elif name == "update_record":
+        if arguments.get("fields"):
+            records = await client.update_and_read(
+                model=arguments["model"],
+                ids=[arguments["record_id"]],
+                values=arguments["values"],
+                fields=arguments["fields"]
+            )
+            result = {"success": True, "record": records[0] if records else None}
+            return [TextContent(type="text", text=json.dumps(result, default=str))]
+
         success = await client.write(
             model=arguments["model"],
             ids=[arguments["record_id"]],
@@ -212,6 +257,15 @@ async def execute_tool(
         )
         return [TextContent(type="text", text=json.dumps({"count": count}))]
 
+    elif name == "read_group":
+        groups = await client.read_group(
+            model=arguments["model"],
+            domain=arguments.get("domain", []),
+            fields=arguments["fields"],
+            groupby=arguments.get("groupby", [])
+        )
+        return [TextContent(type="text", text=json.dumps(groups, default=str))]
+
     elif name == "list_models":
         # Get accessible models
         models = await client.search_read(
@@ -6,12 +6,17 @@ and test data management.
 """
 
 import asyncio
+import hashlib
 import json
 import os
+import time
 from collections.abc import AsyncGenerator
 
 import httpx
 import pytest
+import pytest_asyncio
+
+from tests.tool_results import unwrap_tool_result
 
 # Configuration from environment
 TEST_CONFIG = {
@@ -27,95 +32,109 @@ TEST_CONFIG = {
 }
 
 
+# pytest cache entry for list_tools(); only fetches slower than this are stored
+TOOL_LIST_CACHE_KEY = "odoo_mcp/tools"
+TOOL_LIST_CACHE_MIN_SECONDS = 0.1
+
+
 @pytest.fixture
 def test_config() -> dict:
     """Return test configuration."""
     return TEST_CONFIG
 
 
-@pytest.fixture
+async def _prewarm(client: httpx.AsyncClient, url: str) -> None:
+    """Open a pooled connection to url so the first test skips DNS/TLS setup."""
+    try:
+        await client.head(url, timeout=5.0)
+    except httpx.HTTPError:
+        pass  # Warm-up is best effort; the test itself reports real failures
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def http_client() -> AsyncGenerator[httpx.AsyncClient, None]:
-    """Provide async HTTP client."""
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    """Provide a session-wide async HTTP client with keep-alive pooling."""
+    async with httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    ) as client:
+        # Only warm up when live servers are configured for this run
+        if TEST_CONFIG["test_client_id"]:
+            await asyncio.gather(
+                _prewarm(client, f"{TEST_CONFIG['mcp_server_url']}/health"),
+                _prewarm(client, TEST_CONFIG["auth_server_url"]),
+            )
         yield client
 
 
-@pytest.fixture
-async def valid_access_token() -> str | None:
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def valid_access_token(http_client: httpx.AsyncClient) -> str | None:
     """
     Obtain a valid OAuth access token for testing.
 
-    In CI/CD, this uses client credentials grant.
+    In CI/CD, this uses client credentials grant. The token is requested
+    once per session and shared by every client fixture.
     """
     if not TEST_CONFIG["test_client_id"]:
         pytest.skip("TEST_CLIENT_ID not configured")
         return None
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{TEST_CONFIG['auth_server_url']}/token",
-            data={
-                "grant_type": "client_credentials",
-                "client_id": TEST_CONFIG["test_client_id"],
-                "client_secret": TEST_CONFIG["test_client_secret"],
-                "scope": "openid odoo.read odoo.write",
-            },
-        )
+    response = await http_client.post(
+        f"{TEST_CONFIG['auth_server_url']}/token",
+        data={
+            "grant_type": "client_credentials",
+            "client_id": TEST_CONFIG["test_client_id"],
+            "client_secret": TEST_CONFIG["test_client_secret"],
+            "scope": "openid odoo.read odoo.write",
+        },
+    )
 
-        if response.status_code != 200:
-            pytest.skip("Could not obtain test access token")
-            return None
+    if response.status_code != 200:
+        pytest.skip("Could not obtain test access token")
+        return None
 
-        tokens = response.json()
-        return tokens["access_token"]
+    tokens = response.json()
+    return tokens["access_token"]
 
 
-@pytest.fixture
-async def valid_refresh_token() -> str | None:
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def valid_refresh_token(http_client: httpx.AsyncClient) -> str | None:
     """Obtain a valid refresh token for testing."""
     if not TEST_CONFIG["test_client_id"]:
         pytest.skip("TEST_CLIENT_ID not configured")
         return None
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{TEST_CONFIG['auth_server_url']}/token",
-            data={
-                "grant_type": "client_credentials",
-                "client_id": TEST_CONFIG["test_client_id"],
-                "client_secret": TEST_CONFIG["test_client_secret"],
-                "scope": "openid odoo.read odoo.write offline_access",
-            },
-        )
+    response = await http_client.post(
+        f"{TEST_CONFIG['auth_server_url']}/token",
+        data={
+            "grant_type": "client_credentials",
+            "client_id": TEST_CONFIG["test_client_id"],
+            "client_secret": TEST_CONFIG["test_client_secret"],
+            "scope": "openid odoo.read odoo.write offline_access",
+        },
+    )
 
-        if response.status_code != 200:
-            pytest.skip("Could not obtain test refresh token")
-            return None
+    if response.status_code != 200:
+        pytest.skip("Could not obtain test refresh token")
+        return None
 
-        tokens = response.json()
-        return tokens.get("refresh_token")
+    tokens = response.json()
+    return tokens.get("refresh_token")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pkce_challenge() -> dict:
-    """Generate PKCE code verifier and challenge."""
-    import base64
-    import hashlib
-    import secrets
-
-    code_verifier = secrets.token_urlsafe(32)
-    code_challenge = (
-        base64.urlsafe_b64encode(hashlib.sha256(code_verifier.encode()).digest())
-        .rstrip(b"=")
-        .decode()
-    )
+    """Generate one PKCE code verifier and challenge pair for the session."""
+    from tests.pkce import generate_pkce
+
+    [(code_verifier, code_challenge)] = generate_pkce()
     return {"verifier": code_verifier, "challenge": code_challenge}
 
 
 # Placeholder fixtures for MCP client - implement when MCP library is installed
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def mcp_client():
     """Create unauthenticated MCP client for protocol tests."""
     # TODO: Implement with actual MCP client
@@ -123,9 +142,57 @@ async def mcp_client():
     yield None
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mcp_initialize_result(mcp_client):
+    """Perform the MCP initialize handshake once per session."""
+    return await mcp_client.initialize()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def initialized_mcp_client(mcp_client, mcp_initialize_result):
+    """MCP client that has already completed capability negotiation."""
+    return mcp_client
+
+
+def _registered_tools_digest() -> str:
+    """SHA-256 of the tool definitions this checkout registers; changes whenever a tool is edited."""
+    from odoo_mcp_server.tools import register_tools
+
+    definitions = [tool.model_dump(mode="json") for tool in register_tools()]
+    return hashlib.sha256(json.dumps(definitions, sort_keys=True).encode()).hexdigest()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def tool_list(request, initialized_mcp_client, mcp_initialize_result):
+    """
+    Tools advertised by the server (deterministic per server build).
+
+    Slow fetches are persisted in the pytest cache keyed by server version
+    and a digest of the locally registered tool definitions, so repeated
+    local runs (--lf, -k) skip the list_tools round-trip until a tool's
+    name, description or schema changes.
+    """
+    from mcp.types import ListToolsResult
+
+    server_version = mcp_initialize_result.serverInfo.version
+    tools_digest = _registered_tools_digest()
+    cached = request.config.cache.get(TOOL_LIST_CACHE_KEY, None)
+    if cached and cached.get("server_version") == server_version and cached.get("tools_digest") == tools_digest:
+        return ListToolsResult.model_validate(cached["tools"])
+
+    started = time.perf_counter()
+    tools = await initialized_mcp_client.list_tools()
+    if time.perf_counter() - started > TOOL_LIST_CACHE_MIN_SECONDS:
+        request.config.cache.set(
+            TOOL_LIST_CACHE_KEY,
+            {"server_version": server_version, "tools_digest": tools_digest, "tools": tools.model_dump(mode="json")},
+        )
+    return tools
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def authenticated_mcp_client(valid_access_token: str | None):
-    """Create authenticated MCP client."""
+    """Create authenticated MCP client shared by the whole session."""
     if not valid_access_token:
         pytest.skip("No valid access token available")
 
@@ -134,7 +201,7 @@ async def authenticated_mcp_client(valid_access_token: str | None):
     yield None
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def odoo_client():
     """Create direct Odoo client for integration tests."""
     if not TEST_CONFIG["test_api_key"]:
@@ -145,7 +212,13 @@ async def odoo_client():
     yield None
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def odoo_version(odoo_client) -> dict:
+    """Odoo server version info, fetched once per session."""
+    return await odoo_client.get_version()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
 async def test_partner_id(authenticated_mcp_client) -> int:
     """Create a test partner and return its ID, cleanup after test."""
     if not authenticated_mcp_client:
@@ -163,7 +236,7 @@ async def test_partner_id(authenticated_mcp_client) -> int:
         },
     )
 
-    record = json.loads(result.content[0].text)
+    record = unwrap_tool_result(result)
     record_id = record["id"]
 
     yield record_id
@@ -178,7 +251,73 @@ async def test_partner_id(authenticated_mcp_client) -> int:
         pass  # Ignore cleanup errors
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def first_company_partner_id(authenticated_mcp_client) -> int | bool:
+    """Look up a company partner once per session, or False if none exist."""
+    result = await authenticated_mcp_client.call_tool(
+        "search_records",
+        arguments={
+            "model": "res.partner",
+            "domain": [["is_company", "=", True]],
+            "fields": ["id", "name"],
+            "limit": 1,
+        },
+    )
+
+    partners = unwrap_tool_result(result)
+    return partners[0]["id"] if partners else False
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def first_active_leave_type_id(authenticated_mcp_client) -> int:
+    """Look up an active leave type once per session."""
+    result = await authenticated_mcp_client.call_tool(
+        "search_records",
+        arguments={
+            "model": "hr.leave.type",
+            "domain": [["active", "=", True]],
+            "fields": ["id", "name"],
+            "limit": 1,
+        },
+    )
+
+    leave_types = unwrap_tool_result(result)
+    if not leave_types:
+        pytest.skip("No leave types available")
+
+    return leave_types[0]["id"]
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def transient_record(authenticated_mcp_client):
+    """
+    Register records created by a test for deletion after it finishes.
+
+    Call the yielded function with ``(model, record_id)`` right after
+    ``create_record``; all registered records are deleted concurrently
+    during teardown.
+    """
+    created: list[tuple[str, int]] = []
+
+    def register(model: str, record_id: int) -> None:
+        created.append((model, record_id))
+
+    yield register
+
+    # Cleanup - ignore errors so one failed delete doesn't mask the others
+    await asyncio.gather(
+        *(
+            authenticated_mcp_client.call_tool(
+                "delete_record",
+                arguments={"model": model, "record_id": record_id},
+            )
+            for model, record_id in created
+        ),
+        return_exceptions=True,
+    )
+
+
+@pytest_asyncio.fixture(loop_scope="session")
 async def test_employee_id(authenticated_mcp_client) -> int:
     """Get or create a test employee."""
     if not authenticated_mcp_client:
@@ -191,11 +330,12 @@ async def test_employee_id(authenticated_mcp_client) -> int:
         arguments={
             "model": "hr.employee",
             "domain": [["name", "=", "MCP Test Employee"]],
+            "fields": ["id"],
             "limit": 1,
         },
     )
 
-    employees = json.loads(result.content[0].text)
+    employees = unwrap_tool_result(result)
 
     if employees:
         return employees[0]["id"]
@@ -206,11 +346,11 @@ async def test_employee_id(authenticated_mcp_client) -> int:
         arguments={"model": "hr.employee", "values": {"name": "MCP Test Employee"}},
     )
 
-    employee = json.loads(create_result.content[0].text)
+    employee = unwrap_tool_result(create_result)
     return employee["id"]
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def authenticated_employee_client(valid_access_token: str | None):
     """
     Create authenticated MCP client configured for employee self-service.
@@ -15,7 +15,6 @@ Run with: pytest tests/e2e/test_agent_sdk.py -v
 
 import os
 import sys
-from pathlib import Path
 
 import pytest
 
@@ -29,9 +28,6 @@ pytestmark.append(
     )
 )
 
-PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT / "src"))
-
 
 @pytest.fixture
 def mcp_server_command():
@@ -0,0 +1,64 @@
+"""
+Pytest Configuration for Integration Tests
+
+Probes the Odoo server once per session and skips the Odoo-backed
+integration tests up front when it is unreachable, instead of letting
+every test wait out its own connection timeout.
+
+Tests in the "writes" xdist group are moved after all read-only tests so
+cached read results stay valid for as long as possible.
+"""
+
+import os
+import socket
+from functools import cache
+from pathlib import Path
+from urllib.parse import urlparse
+
+import pytest
+
+INTEGRATION_DIR = Path(__file__).parent
+PROBE_TIMEOUT_SECONDS = 1.0
+
+
+@cache
+def is_odoo_server_available(url: str) -> bool:
+    """Return True if a TCP connection to the Odoo host can be opened."""
+    parsed = urlparse(url)
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    try:
+        with socket.create_connection((parsed.hostname, port), timeout=PROBE_TIMEOUT_SECONDS):
+            return True
+    except OSError:
+        return False
+
+
+def _is_write_test(item) -> bool:
+    marker = item.get_closest_marker("xdist_group")
+    return marker is not None and "writes" in (*marker.args, marker.kwargs.get("name"))
+
+
+def pytest_collection_modifyitems(config, items):
+    """Run write tests last; skip live/odoo integration tests when Odoo is unreachable."""
+    # Stable sort: reads keep their relative order, writes move to the end
+    items.sort(key=_is_write_test)
+
+    if not (os.getenv("ODOO_API_KEY") or os.getenv("TEST_ODOO_API_KEY")):
+        return  # Without credentials these tests skip themselves; no need to probe
+
+    odoo_items = [
+        item
+        for item in items
+        if INTEGRATION_DIR in item.path.parents
+        and (item.get_closest_marker("live") or item.get_closest_marker("odoo"))
+    ]
+    if not odoo_items:
+        return
+
+    odoo_url = os.getenv("ODOO_URL") or os.getenv("TEST_ODOO_URL", "https://erp.internal.keboola.com")
+    if is_odoo_server_available(odoo_url):
+        return
+
+    skip_unreachable = pytest.mark.skip(reason=f"Odoo unreachable at {odoo_url}")
+    for item in odoo_items:
+        item.add_marker(skip_unreachable)
@@ -5,28 +5,27 @@ Tests the MCP server's integration with Odoo ERP, including
 record operations, permissions, and data handling.
 
 Run with: pytest tests/integration/test_odoo_integration.py -v -m odoo
+Parallel: pytest tests/integration -n auto --dist=loadgroup
 """
 
-import json
-
+import orjson
 import pytest
 
-pytestmark = [pytest.mark.integration, pytest.mark.odoo]
+# authenticated_mcp_client is session-scoped, so tests share its event loop
+pytestmark = [pytest.mark.integration, pytest.mark.odoo, pytest.mark.asyncio(loop_scope="session")]
 
 
 class TestOdooConnection:
     """Tests for Odoo connection handling."""
 
-    async def test_connection_to_odoo_instance(self, odoo_client):
+    def test_connection_to_odoo_instance(self, odoo_version):
         """
         GIVEN: Valid Odoo credentials
         WHEN: Client attempts to connect
         THEN: Connection is established successfully
         """
-        version = await odoo_client.get_version()
-
-        assert version is not None
-        assert "18" in version.get("server_version", "")
+        assert odoo_version is not None
+        assert "18" in odoo_version.get("server_version", "")
 
     async def test_authentication_with_api_key(self, odoo_client):
         """
@@ -61,7 +60,7 @@ class TestOdooRecordOperations:
         )
 
         assert result.content is not None
-        records = json.loads(result.content[0].text)
+        records = orjson.loads(result.content[0].text)
         assert isinstance(records, list)
 
     async def test_get_single_record(self, authenticated_mcp_client):
@@ -80,9 +79,10 @@ class TestOdooRecordOperations:
         )
 
         assert result.content is not None
-        record = json.loads(result.content[0].text)
+        record = orjson.loads(result.content[0].text)
         assert "name" in record
 
+    @pytest.mark.xdist_group("writes")
     async def test_create_and_delete_record(self, authenticated_mcp_client):
         """
         GIVEN: Authenticated client with write permissions
@@ -102,7 +102,7 @@ class TestOdooRecordOperations:
             },
         )
 
-        created = json.loads(create_result.content[0].text)
+        created = orjson.loads(create_result.content[0].text)
         record_id = created["id"]
         assert record_id > 0
 
@@ -114,33 +114,25 @@ class TestOdooRecordOperations:
 
         assert "success" in delete_result.content[0].text.lower()
 
+    @pytest.mark.xdist_group("writes")
     async def test_update_record(self, authenticated_mcp_client, test_partner_id: int):
         """
         GIVEN: Existing partner record
         WHEN: Updating record fields
         THEN: Changes are persisted
         """
-        # Update
-        await authenticated_mcp_client.call_tool(
+        # Update and read back the persisted value in one call
+        result = await authenticated_mcp_client.call_tool(
             "update_record",
             arguments={
                 "model": "res.partner",
                 "record_id": test_partner_id,
                 "values": {"phone": "+1-555-0123"},
-            },
-        )
-
-        # Verify
-        result = await authenticated_mcp_client.call_tool(
-            "get_record",
-            arguments={
-                "model": "res.partner",
-                "record_id": test_partner_id,
                 "fields": ["phone"],
             },
         )
 
-        record = json.loads(result.content[0].text)
+        record = orjson.loads(result.content[0].text)["record"]
         assert record["phone"] == "+1-555-0123"
 
 
@@ -179,7 +171,7 @@ class TestOdooPermissions:
             "list_models", arguments={}
         )
 
-        models = json.loads(result.content[0].text)
+        models = orjson.loads(result.content[0].text)
         model_names = [m["model"] for m in models]
 
         # User-facing models should be available
@@ -206,7 +198,7 @@ class TestOdooDataFormatting:
             },
         )
 
-        records = json.loads(result.content[0].text)
+        records = orjson.loads(result.content[0].text)
         assert len(records) <= 5
 
     async def test_count_records(self, authenticated_mcp_client):
@@ -223,6 +215,6 @@ class TestOdooDataFormatting:
             },
         )
 
-        count_data = json.loads(result.content[0].text)
+        count_data = orjson.loads(result.content[0].text)
         assert "count" in count_data
         assert isinstance(count_data["count"], int)
@@ -0,0 +1,71 @@
+"""
+Pytest Fixtures for MCP Protocol Tests
+
+Starts one stdio MCP server per pytest session. Under pytest-xdist every
+worker runs its own session, so each worker gets a private server and the
+tool tests parallelize without sharing a single-consumer stdio pipe.
+"""
+
+import asyncio
+import os
+import sys
+from contextlib import AsyncExitStack
+
+import pytest
+import pytest_asyncio
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+
+@pytest.fixture(scope="session")
+def server_params():
+    """Get MCP server parameters for stdio connection."""
+    return StdioServerParameters(
+        command=sys.executable,
+        args=["-m", "odoo_mcp_server.server"],
+        env={
+            **os.environ,
+            "ODOO_URL": os.getenv("ODOO_URL", "https://erp.internal.keboola.com"),
+            "ODOO_DB": os.getenv("ODOO_DB", "keboola-community"),
+            "ODOO_API_KEY": os.getenv("ODOO_API_KEY", ""),
+        },
+    )
+
+
+async def _hold_session(server_params, connected: asyncio.Future, stop: asyncio.Event) -> None:
+    """Own the stdio connection in one task; anyio scopes must exit where they were entered."""
+    try:
+        async with AsyncExitStack() as stack:
+            read, write = await stack.enter_async_context(stdio_client(server_params))
+            session = await stack.enter_async_context(ClientSession(read, write))
+            connected.set_result((session, await session.initialize()))
+            await stop.wait()
+    except BaseException as exc:
+        if not connected.done():
+            connected.set_exception(exc)
+        raise
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mcp_handshake(server_params):
+    """Start the stdio server once per session and complete the MCP handshake."""
+    connected = asyncio.get_running_loop().create_future()
+    stop = asyncio.Event()
+    holder = asyncio.create_task(_hold_session(server_params, connected, stop))
+
+    yield await connected
+
+    stop.set()
+    await holder
+
+
+@pytest.fixture(scope="session")
+def mcp_session(mcp_handshake):
+    """Initialized MCP client session shared by all tests."""
+    return mcp_handshake[0]
+
+
+@pytest.fixture(scope="session")
+def initialize_result(mcp_handshake):
+    """Result of the session's single initialize() call."""
+    return mcp_handshake[1]
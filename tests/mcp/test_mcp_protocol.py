@@ -7,315 +7,207 @@ to the server via stdio and testing tools directly.
 No Claude login or browser required!
 
 Run with: pytest tests/mcp/test_mcp_protocol.py -v
+Parallel: pytest tests/mcp -m mcp -n auto
 """
 
-import json
 import os
-import sys
-from pathlib import Path
 
+import orjson
 import pytest
+from mcp.shared.exceptions import McpError
 
-pytestmark = [pytest.mark.mcp]
+# One stdio server is shared by the whole session, so tests share its event loop
+pytestmark = [pytest.mark.mcp, pytest.mark.asyncio(loop_scope="session")]
 
-# Add src to path for imports
-PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
-
-@pytest.fixture
-def server_params():
-    """Get MCP server parameters for stdio connection."""
-    from mcp import StdioServerParameters
-
-    return StdioServerParameters(
-        command=sys.executable,
-        args=["-m", "odoo_mcp_server.server"],
-        env={
-            **os.environ,
-            "ODOO_URL": os.getenv("ODOO_URL", "https://erp.internal.keboola.com"),
-            "ODOO_DB": os.getenv("ODOO_DB", "keboola-community"),
-            "ODOO_API_KEY": os.getenv("ODOO_API_KEY", ""),
-        },
-    )
+def _parsed(result):
+    """Return a tool result's structured content, falling back to parsing the text block."""
+    structured = result.structuredContent
+    if structured is None:
+        return orjson.loads(result.content[0].text)
+    # Non-object results are wrapped as {"result": ...} by the server
+    return structured["result"] if structured.keys() == {"result"} else structured
 
 
 class TestMCPServerConnection:
     """Test basic MCP server connection and initialization."""
 
-    async def test_server_starts_and_responds(self, server_params):
+    async def test_server_starts_and_responds(self, initialize_result):
         """
         GIVEN: MCP server configuration
         WHEN: Client connects via stdio
         THEN: Server initializes successfully
         """
-        from mcp import ClientSession
-        from mcp.client.stdio import stdio_client
-
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                result = await session.initialize()
+        assert initialize_result is not None
+        assert initialize_result.serverInfo is not None
+        assert "odoo" in initialize_result.serverInfo.name.lower()
 
-                assert result is not None
-                assert result.serverInfo is not None
-                assert "odoo" in result.serverInfo.name.lower()
-
-    async def test_server_reports_capabilities(self, server_params):
+    async def test_server_reports_capabilities(self, initialize_result):
         """
         GIVEN: Connected MCP session
         WHEN: Checking server capabilities
         THEN: Server reports tool and resource capabilities
         """
-        from mcp import ClientSession
-        from mcp.client.stdio import stdio_client
-
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                result = await session.initialize()
-
-                # Server should support tools
-                assert result.capabilities is not None
+        # Server should support tools
+        assert initialize_result.capabilities is not None
 
 
 class TestMCPToolListing:
     """Test MCP tool discovery."""
 
-    async def test_list_tools_returns_employee_tools(self, server_params):
+    async def test_tool_metadata(self, mcp_session):
         """
         GIVEN: Connected MCP session
         WHEN: Listing available tools
-        THEN: Employee self-service tools are present
+        THEN: Employee self-service tools are present and every tool
+              has a description and an input schema
         """
-        from mcp import ClientSession
-        from mcp.client.stdio import stdio_client
-
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                tools_result = await session.list_tools()
-
-                tool_names = [t.name for t in tools_result.tools]
-
-                # Expected employee tools
-                expected_tools = [
-                    "get_my_profile",
-                    "get_my_manager",
-                    "find_colleague",
-                    "get_my_leave_balance",
-                    "get_my_leave_requests",
-                    "get_my_documents",
-                    "get_document_categories",
-                ]
-
-                for expected in expected_tools:
-                    assert expected in tool_names, f"Missing tool: {expected}"
-
-    async def test_tools_have_descriptions(self, server_params):
-        """
-        GIVEN: Connected MCP session
-        WHEN: Listing tools
-        THEN: Each tool has a description
-        """
-        from mcp import ClientSession
-        from mcp.client.stdio import stdio_client
+        tools_result = await mcp_session.list_tools()
 
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                tools_result = await session.list_tools()
+        tool_names = [t.name for t in tools_result.tools]
 
-                for tool in tools_result.tools:
-                    assert tool.description, f"Tool {tool.name} has no description"
-                    assert len(tool.description) > 10, f"Tool {tool.name} description too short"
-
-    async def test_tools_have_input_schemas(self, server_params):
-        """
-        GIVEN: Connected MCP session
-        WHEN: Listing tools
-        THEN: Each tool has an input schema
-        """
-        from mcp import ClientSession
-        from mcp.client.stdio import stdio_client
+        # Expected employee tools
+        expected_tools = [
+            "get_my_profile",
+            "get_my_manager",
+            "find_colleague",
+            "get_my_leave_balance",
+            "get_my_leave_requests",
+            "get_my_documents",
+            "get_document_categories",
+        ]
 
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                tools_result = await session.list_tools()
+        for expected in expected_tools:
+            assert expected in tool_names, f"Missing tool: {expected}"
 
-                for tool in tools_result.tools:
-                    assert tool.inputSchema is not None, f"Tool {tool.name} has no input schema"
+        for tool in tools_result.tools:
+            assert tool.description, f"Tool {tool.name} has no description"
+            assert len(tool.description) > 10, f"Tool {tool.name} description too short"
+            assert tool.inputSchema is not None, f"Tool {tool.name} has no input schema"
 
 
+@pytest.mark.skipif(
+    not os.getenv("ODOO_API_KEY"),
+    reason="ODOO_API_KEY not configured"
+)
 class TestMCPToolExecution:
-    """Test MCP tool execution."""
+    """
+    Test MCP tool execution.
+
+    All live calls go through the shared mcp_session, so the server
+    authenticates to Odoo once for the whole class.
+    """
 
-    @pytest.mark.skipif(
-        not os.getenv("ODOO_API_KEY"),
-        reason="ODOO_API_KEY not configured"
-    )
-    async def test_get_my_profile_returns_data(self, server_params):
+    async def test_get_my_profile_returns_data(self, mcp_session):
         """
         GIVEN: Connected MCP session with valid Odoo credentials
         WHEN: Calling get_my_profile tool
         THEN: Profile data is returned
         """
-        from mcp import ClientSession
-        from mcp.client.stdio import stdio_client
-
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-
-                # Call the tool
-                result = await session.call_tool(
-                    "get_my_profile",
-                    arguments={"employee_id": int(os.getenv("TEST_EMPLOYEE_ID", "1"))}
-                )
-
-                # Should have content
-                assert result.content is not None
-                assert len(result.content) > 0
-
-                # Content should be text with JSON
-                content = result.content[0]
-                assert content.type == "text"
-
-                # Parse the JSON
-                profile = json.loads(content.text)
-                assert "name" in profile
-
-    @pytest.mark.skipif(
-        not os.getenv("ODOO_API_KEY"),
-        reason="ODOO_API_KEY not configured"
-    )
-    async def test_get_my_leave_balance_returns_data(self, server_params):
+        # Call the tool
+        result = await mcp_session.call_tool(
+            "get_my_profile",
+            arguments={"employee_id": int(os.getenv("TEST_EMPLOYEE_ID", "1"))}
+        )
+
+        # Should have content
+        assert result.content is not None
+        assert len(result.content) > 0
+
+        # Content should be text with JSON
+        content = result.content[0]
+        assert content.type == "text"
+
+        profile = _parsed(result)
+        assert "name" in profile
+
+    async def test_get_my_leave_balance_returns_data(self, mcp_session):
         """
         GIVEN: Connected MCP session with valid Odoo credentials
         WHEN: Calling get_my_leave_balance tool
         THEN: Leave balance data is returned
         """
-        from mcp import ClientSession
-        from mcp.client.stdio import stdio_client
-
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-
-                result = await session.call_tool(
-                    "get_my_leave_balance",
-                    arguments={"employee_id": int(os.getenv("TEST_EMPLOYEE_ID", "1"))}
-                )
-
-                assert result.content is not None
-                assert len(result.content) > 0
-
-    @pytest.mark.skipif(
-        not os.getenv("ODOO_API_KEY"),
-        reason="ODOO_API_KEY not configured"
-    )
-    async def test_find_colleague_returns_results(self, server_params):
+        result = await mcp_session.call_tool(
+            "get_my_leave_balance",
+            arguments={"employee_id": int(os.getenv("TEST_EMPLOYEE_ID", "1"))}
+        )
+
+        assert result.content is not None
+        assert len(result.content) > 0
+
+    async def test_find_colleague_returns_results(self, mcp_session):
         """
         GIVEN: Connected MCP session with valid Odoo credentials
         WHEN: Searching for a colleague
         THEN: Search results are returned
         """
-        from mcp import ClientSession
-        from mcp.client.stdio import stdio_client
-
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
+        result = await mcp_session.call_tool(
+            "find_colleague",
+            arguments={"name": "test"}
+        )
 
-                result = await session.call_tool(
-                    "find_colleague",
-                    arguments={"name": "test"}
-                )
-
-                assert result.content is not None
-                # Even empty results should return valid JSON
-                content = result.content[0]
-                data = json.loads(content.text)
-                assert isinstance(data, list)
+        assert result.content is not None
+        # Even empty results should return valid JSON
+        data = _parsed(result)
+        assert isinstance(data, list)
 
 
 class TestMCPResourceListing:
     """Test MCP resource discovery."""
 
-    async def test_list_resources(self, server_params):
+    async def test_list_resources(self, mcp_session):
         """
         GIVEN: Connected MCP session
         WHEN: Listing resources
         THEN: Resources are returned (may be empty)
         """
-        from mcp import ClientSession
-        from mcp.client.stdio import stdio_client
-
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-
-                try:
-                    resources_result = await session.list_resources()
-                    # Resources may or may not be implemented
-                    assert resources_result is not None
-                except Exception:
-                    # Resources not implemented is OK
-                    pytest.skip("Resources not implemented")
+        try:
+            resources_result = await mcp_session.list_resources()
+            # Resources may or may not be implemented
+            assert resources_result is not None
+        except Exception:
+            # Resources not implemented is OK
+            pytest.skip("Resources not implemented")
 
 
 class TestMCPErrorHandling:
     """Test MCP error handling."""
 
-    async def test_invalid_tool_returns_error(self, server_params):
+    async def test_invalid_tool_returns_error(self, mcp_session):
         """
         GIVEN: Connected MCP session
         WHEN: Calling non-existent tool
         THEN: Error response is returned
         """
-        from mcp import ClientSession
-        from mcp.client.stdio import stdio_client
-        from mcp.shared.exceptions import McpError
-
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-
-                # May raise McpError or return error content
-                try:
-                    result = await session.call_tool(
-                        "nonexistent_tool",
-                        arguments={}
-                    )
-                    # If no exception, check result contains error
-                    if result.content:
-                        content = result.content[0].text
-                        # Check for error indication
-                        assert "error" in content.lower() or result.isError
-                except McpError:
-                    # This is expected behavior
-                    pass
-
-    async def test_missing_required_argument_returns_error(self, server_params):
+        # May raise McpError or return error content
+        try:
+            result = await mcp_session.call_tool(
+                "nonexistent_tool",
+                arguments={}
+            )
+            # If no exception, check result contains error
+            if result.content:
+                content = result.content[0].text
+                # Check for error indication
+                assert "error" in content.lower() or result.isError
+        except McpError:
+            # This is expected behavior
+            pass
+
+    async def test_missing_required_argument_returns_error(self, mcp_session):
         """
         GIVEN: Connected MCP session
         WHEN: Calling tool without required arguments
         THEN: Error response is returned
         """
-        from mcp import ClientSession
-        from mcp.client.stdio import stdio_client
-
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-
-                # find_colleague requires 'name' argument
-                result = await session.call_tool(
-                    "find_colleague",
-                    arguments={}  # Missing required 'name'
-                )
-
-                # Should return error content or raise exception
-                if result.content:
-                    content = result.content[0].text
-                    # Either has error or is handled gracefully
-                    assert content is not None
+        # find_colleague requires 'name' argument
+        result = await mcp_session.call_tool(
+            "find_colleague",
+            arguments={}  # Missing required 'name'
+        )
+
+        # Should return error content or raise exception
+        if result.content:
+            content = result.content[0].text
+            # Either has error or is handled gracefully
+            assert content is not None
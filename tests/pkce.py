@@ -0,0 +1,58 @@
+"""
+PKCE (RFC 7636) Code Verifier and Challenge Generation
+
+Test helper that generates S256 code verifier/challenge pairs for OAuth 2.1
+authorization code flows. The server is a resource server and never runs
+that flow itself, so this lives with the tests.
+"""
+
+import base64
+import hashlib
+import secrets
+
+# 32 random bytes encode to a 43-character base64url verifier (RFC 7636 minimum)
+VERIFIER_BYTES = 32
+
+# On OpenSSL builds hashlib.sha256 is already the OpenSSL constructor (SHA-NI
+# when the CPU has it); bind it once and hash each verifier in one call
+_sha256 = hashlib.sha256
+
+# Unpadded base64url lengths are fixed, so padding is sliced off instead of stripped
+_VERIFIER_LENGTH = (VERIFIER_BYTES * 4 + 2) // 3
+_CHALLENGE_LENGTH = (_sha256().digest_size * 4 + 2) // 3
+
+
+def code_challenge(verifier: str | bytes) -> str:
+    """
+    Compute the S256 code challenge for a verifier.
+
+    Args:
+        verifier: PKCE code verifier (ASCII)
+
+    Returns:
+        base64url(SHA-256(verifier)) without padding
+    """
+    if isinstance(verifier, str):
+        verifier = verifier.encode("ascii")
+    return base64.urlsafe_b64encode(_sha256(verifier).digest())[:_CHALLENGE_LENGTH].decode("ascii")
+
+
+def generate_pkce(n: int = 1) -> list[tuple[str, str]]:
+    """
+    Generate PKCE code verifier/challenge pairs.
+
+    Random bytes for all pairs are drawn with a single secrets.token_bytes()
+    call and sliced per verifier.
+
+    Args:
+        n: Number of pairs to generate
+
+    Returns:
+        List of (verifier, challenge) tuples
+    """
+    raw = memoryview(secrets.token_bytes(VERIFIER_BYTES * n))
+    pairs = []
+    for offset in range(0, VERIFIER_BYTES * n, VERIFIER_BYTES):
+        verifier = base64.urlsafe_b64encode(raw[offset:offset + VERIFIER_BYTES])[:_VERIFIER_LENGTH]
+        pairs.append((verifier.decode("ascii"), code_challenge(verifier)))
+    return pairs
@@ -0,0 +1,17 @@
+"""
+MCP Tool Result Decoding
+
+Test helper shared by fixtures and tests so every tool result is decoded
+the same way: structured content first, the JSON text block as a fallback.
+"""
+
+import json
+
+
+def unwrap_tool_result(result):
+    """Return a tool result's structured content, parsing the text block only as a fallback."""
+    structured = getattr(result, "structuredContent", None)
+    if structured is None:
+        return json.loads(result.content[0].text)
+    # Non-object results are wrapped as {"result": ...} by the server
+    return structured["result"] if structured.keys() == {"result"} else structured
@@ -6,107 +6,69 @@ Run with: pytest tests/unit/test_config.py -v -m unit
 
 import pytest
 
+from odoo_mcp_server.config import Settings
+
 pytestmark = [pytest.mark.unit]
 
+# (attribute, expected default); env var names are the upper-cased attributes
+DEFAULT_CASES = [
+    ("odoo_url", "https://erp.internal.keboola.com"),
+    ("odoo_db", "keboola-community"),
+    ("odoo_api_key", None),
+    ("oauth_authorization_server", "https://accounts.google.com"),
+    ("oauth_resource_identifier", "https://odoo-mcp.keboola.com"),
+    ("http_host", "0.0.0.0"),
+    ("http_port", 8080),
+    ("debug", False),
+    ("yolo_mode", None),
+]
+
+# (environment variable, raw value, attribute, parsed value)
+CONFIG_CASES = [
+    ("ODOO_URL", "https://custom.odoo.com", "odoo_url", "https://custom.odoo.com"),
+    ("ODOO_DB", "custom_db", "odoo_db", "custom_db"),
+    ("ODOO_API_KEY", "secret_key_123", "odoo_api_key", "secret_key_123"),
+    ("OAUTH_AUTHORIZATION_SERVER", "https://auth0.example.com", "oauth_authorization_server", "https://auth0.example.com"),
+    ("HTTP_PORT", "9000", "http_port", 9000),
+    ("DEBUG", "true", "debug", True),
+    ("YOLO_MODE", "read", "yolo_mode", "read"),
+]
+
+
+@pytest.fixture(scope="session")
+def default_settings() -> Settings:
+    """Settings built once with the environment variables under test cleared."""
+    with pytest.MonkeyPatch.context() as mp:
+        for attr, _ in DEFAULT_CASES:
+            mp.delenv(attr.upper(), raising=False)
+        return Settings()
+
 
 class TestSettingsLoading:
     """Tests for Settings class loading from environment."""
 
-    def test_default_odoo_url(self, monkeypatch):
-        """Default Odoo URL should be set."""
-        # Clear any existing env var
-        monkeypatch.delenv("ODOO_URL", raising=False)
-
-        from odoo_mcp_server.config import Settings
-
-        settings = Settings()
-        assert settings.odoo_url == "https://erp.internal.keboola.com"
-
-    def test_odoo_url_from_env(self, monkeypatch):
-        """Odoo URL should be loaded from environment."""
-        monkeypatch.setenv("ODOO_URL", "https://custom.odoo.com")
-
-        from odoo_mcp_server.config import Settings
-
-        settings = Settings()
-        assert settings.odoo_url == "https://custom.odoo.com"
-
-    def test_default_odoo_db(self, monkeypatch):
-        """Default Odoo database should be set."""
-        monkeypatch.delenv("ODOO_DB", raising=False)
-
-        from odoo_mcp_server.config import Settings
+    @pytest.mark.parametrize(("attr", "expected"), DEFAULT_CASES, ids=[case[0] for case in DEFAULT_CASES])
+    def test_default(self, default_settings, attr, expected):
+        """Each setting should have its documented default when the env var is unset."""
+        assert getattr(default_settings, attr) == expected
 
-        settings = Settings()
-        assert settings.odoo_db == "keboola-community"
+    @pytest.mark.parametrize(("env", "value", "attr", "expected"), CONFIG_CASES, ids=[case[0] for case in CONFIG_CASES])
+    def test_env_override(self, monkeypatch, env, value, attr, expected):
+        """Each setting should be loaded (and parsed) from its environment variable."""
+        monkeypatch.setenv(env, value)
 
-    def test_odoo_db_from_env(self, monkeypatch):
-        """Odoo database should be loaded from environment."""
-        monkeypatch.setenv("ODOO_DB", "custom_db")
-
-        from odoo_mcp_server.config import Settings
-
-        settings = Settings()
-        assert settings.odoo_db == "custom_db"
-
-    def test_api_key_from_env(self, monkeypatch):
-        """API key should be loaded from environment."""
-        monkeypatch.setenv("ODOO_API_KEY", "secret_key_123")
-
-        from odoo_mcp_server.config import Settings
-
-        settings = Settings()
-        assert settings.odoo_api_key == "secret_key_123"
-
-    def test_api_key_none_by_default(self, monkeypatch):
-        """API key should be None if not set."""
-        monkeypatch.delenv("ODOO_API_KEY", raising=False)
-
-        from odoo_mcp_server.config import Settings
-
-        settings = Settings()
-        assert settings.odoo_api_key is None
+        assert getattr(Settings(), attr) == expected
 
 
 class TestOAuthSettings:
     """Tests for OAuth configuration settings."""
 
-    def test_default_authorization_server(self, monkeypatch):
-        """Default authorization server should be Google OAuth (default provider)."""
-        monkeypatch.delenv("OAUTH_AUTHORIZATION_SERVER", raising=False)
-
-        from odoo_mcp_server.config import Settings
-
-        settings = Settings()
-        # Default is Google OAuth
-        assert settings.oauth_authorization_server == "https://accounts.google.com"
-
-    def test_authorization_server_from_env(self, monkeypatch):
-        """Authorization server should be loaded from environment."""
-        monkeypatch.setenv("OAUTH_AUTHORIZATION_SERVER", "https://auth0.example.com")
-
-        from odoo_mcp_server.config import Settings
-
-        settings = Settings()
-        assert settings.oauth_authorization_server == "https://auth0.example.com"
-
-    def test_default_resource_identifier(self, monkeypatch):
-        """Default resource identifier should be set."""
-        monkeypatch.delenv("OAUTH_RESOURCE_IDENTIFIER", raising=False)
-
-        from odoo_mcp_server.config import Settings
-
-        settings = Settings()
-        assert settings.oauth_resource_identifier == "https://odoo-mcp.keboola.com"
-
     def test_effective_issuer_defaults_to_auth_server(self, monkeypatch):
         """Effective issuer should use oauth_issuer when set, falling back to auth server."""
         # When oauth_issuer is set explicitly, it takes precedence
         monkeypatch.setenv("OAUTH_ISSUER", "https://auth.example.com")
         monkeypatch.setenv("OAUTH_AUTHORIZATION_SERVER", "https://different.example.com")
 
-        from odoo_mcp_server.config import Settings
-
         settings = Settings()
         # effective_issuer returns oauth_issuer (which is set)
         assert settings.effective_issuer == "https://auth.example.com"
@@ -116,78 +78,5 @@ class TestOAuthSettings:
         monkeypatch.setenv("OAUTH_ISSUER", "https://issuer.example.com")
         monkeypatch.setenv("OAUTH_AUTHORIZATION_SERVER", "https://auth.example.com")
 
-        from odoo_mcp_server.config import Settings
-
         settings = Settings()
         assert settings.effective_issuer == "https://issuer.example.com"
-
-
-class TestHTTPServerSettings:
-    """Tests for HTTP server configuration settings."""
-
-    def test_default_http_host(self, monkeypatch):
-        """Default HTTP host should be 0.0.0.0."""
-        monkeypatch.delenv("HTTP_HOST", raising=False)
-
-        from odoo_mcp_server.config import Settings
-
-        settings = Settings()
-        assert settings.http_host == "0.0.0.0"
-
-    def test_default_http_port(self, monkeypatch):
-        """Default HTTP port should be 8080."""
-        monkeypatch.delenv("HTTP_PORT", raising=False)
-
-        from odoo_mcp_server.config import Settings
-
-        settings = Settings()
-        assert settings.http_port == 8080
-
-    def test_http_port_from_env(self, monkeypatch):
-        """HTTP port should be loaded from environment."""
-        monkeypatch.setenv("HTTP_PORT", "9000")
-
-        from odoo_mcp_server.config import Settings
-
-        settings = Settings()
-        assert settings.http_port == 9000
-
-
-class TestDevelopmentSettings:
-    """Tests for development configuration settings."""
-
-    def test_debug_false_by_default(self, monkeypatch):
-        """Debug should be False by default."""
-        monkeypatch.delenv("DEBUG", raising=False)
-
-        from odoo_mcp_server.config import Settings
-
-        settings = Settings()
-        assert settings.debug is False
-
-    def test_debug_from_env(self, monkeypatch):
-        """Debug should be loaded from environment."""
-        monkeypatch.setenv("DEBUG", "true")
-
-        from odoo_mcp_server.config import Settings
-
-        settings = Settings()
-        assert settings.debug is True
-
-    def test_yolo_mode_none_by_default(self, monkeypatch):
-        """YOLO mode should be None by default."""
-        monkeypatch.delenv("YOLO_MODE", raising=False)
-
-        from odoo_mcp_server.config import Settings
-
-        settings = Settings()
-        assert settings.yolo_mode is None
-
-    def test_yolo_mode_read(self, monkeypatch):
-        """YOLO mode can be set to 'read'."""
-        monkeypatch.setenv("YOLO_MODE", "read")
-
-        from odoo_mcp_server.config import Settings
-
-        settings = Settings()
-        assert settings.yolo_mode == "read"
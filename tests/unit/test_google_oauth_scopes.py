@@ -10,107 +10,60 @@ from odoo_mcp_server.oauth.resource_server import extract_user_context
 
 pytestmark = [pytest.mark.unit, pytest.mark.oauth]
 
-def test_google_token_with_standard_scopes_grants_default_odoo_scopes():
+# Verified Google access token claims; tests override individual fields
+_GOOGLE_CLAIMS_BASE = {
+    "iss": "https://accounts.google.com",
+    "sub": "1234567890",
+    "email": "test@example.com",
+    "email_verified": True,
+    "scope": "openid email profile",  # Standard OIDC scopes
+    "aud": "my-client-id",
+}
+
+# (claim overrides, scopes that must be granted, scopes that must not be)
+CASES = [
+    pytest.param(
+        {},
+        {"openid", "email", "profile", "odoo.read", "odoo.hr.profile", "odoo.leave.read"},
+        set(),
+        id="standard_scopes_grant_default_odoo_scopes",
+    ),
+    pytest.param(
+        # Token already has an odoo scope, so defaults are not added
+        {"scope": "openid odoo.custom.scope"},
+        {"odoo.custom.scope"},
+        {"odoo.read"},
+        id="custom_odoo_scopes_skip_defaults",
+    ),
+    pytest.param(
+        {"iss": "https://other-issuer.com", "sub": "user123", "scope": "openid email"},
+        {"openid"},
+        {"odoo.read"},
+        id="non_google_issuer_gets_no_defaults",
+    ),
+    pytest.param(
+        # Internal users (@keboola.com) get write access
+        {"email": "dev@keboola.com"},
+        {"odoo.write", "odoo.documents.write", "odoo.read"},
+        set(),
+        id="internal_user_gets_write_access",
+    ),
+    pytest.param(
+        {"email_verified": False},
+        {"openid"},
+        {"odoo.read"},
+        id="unverified_email_gets_no_defaults",
+    ),
+]
+
+
+@pytest.mark.parametrize(("overrides", "must_contain", "must_not_contain"), CASES)
+def test_extract_user_context_scopes(overrides, must_contain, must_not_contain):
     """
-    Test that a Google token with 'openid email profile' scopes still gets
-    default Odoo scopes (odoo.read, etc.) if email is verified.
+    Google tokens with a verified email get default Odoo scopes unless they
+    already carry odoo scopes; other issuers and unverified emails do not.
     """
-    # Simulate a Google Access Token claims
-    claims = {
-        "iss": "https://accounts.google.com",
-        "sub": "1234567890",
-        "email": "test@example.com",
-        "email_verified": True,
-        "scope": "openid email profile",  # Standard OIDC scopes
-        "aud": "my-client-id"
-    }
+    scopes = set(extract_user_context(_GOOGLE_CLAIMS_BASE | overrides)["scopes"])
 
-    context = extract_user_context(claims)
-    scopes = context["scopes"]
-
-    # Verify standard scopes are preserved
-    assert "openid" in scopes
-    assert "email" in scopes
-    assert "profile" in scopes
-
-    # Verify Odoo default scopes are ADDED
-    assert "odoo.read" in scopes
-    assert "odoo.hr.profile" in scopes
-    assert "odoo.leave.read" in scopes
-
-def test_google_token_with_custom_odoo_scopes_does_not_add_defaults():
-    """
-    Test that if a Google token ALREADY has odoo scopes (e.g. from a custom flow),
-    we respect them and do not just add defaults blindly (though defaults might be subset).
-    Actually logic says: if NOT has_odoo_scopes, then add defaults.
-    """
-    claims = {
-        "iss": "https://accounts.google.com",
-        "sub": "1234567890",
-        "email": "test@example.com",
-        "email_verified": True,
-        "scope": "openid odoo.custom.scope",  # Has an odoo scope
-        "aud": "my-client-id"
-    }
-
-    context = extract_user_context(claims)
-    scopes = context["scopes"]
-
-    assert "odoo.custom.scope" in scopes
-    # Defaults should NOT be added because has_odoo_scopes is True
-    assert "odoo.read" not in scopes
-
-def test_non_google_token_does_not_get_defaults():
-    """
-    Test that a non-Google token does not get default scopes automatically.
-    """
-    claims = {
-        "iss": "https://other-issuer.com",
-        "sub": "user123",
-        "email": "test@example.com",
-        "email_verified": True,
-        "scope": "openid email",
-    }
-
-    context = extract_user_context(claims)
-    scopes = context["scopes"]
-
-    assert "openid" in scopes
-    assert "odoo.read" not in scopes
-
-def test_google_internal_user_gets_write_access():
-    """
-    Test that internal users (@keboola.com) get write access.
-    """
-    claims = {
-        "iss": "https://accounts.google.com",
-        "sub": "1234567890",
-        "email": "dev@keboola.com",
-        "email_verified": True,
-        "scope": "openid email profile",
-    }
-
-    context = extract_user_context(claims)
-    scopes = context["scopes"]
-
-    assert "odoo.write" in scopes
-    assert "odoo.documents.write" in scopes
-    assert "odoo.read" in scopes
-
-def test_google_token_without_email_verified_gets_no_defaults():
-    """
-    Test that unverified email gets no extra scopes.
-    """
-    claims = {
-        "iss": "https://accounts.google.com",
-        "sub": "1234567890",
-        "email": "test@example.com",
-        "email_verified": False,
-        "scope": "openid email profile",
-    }
-
-    context = extract_user_context(claims)
-    scopes = context["scopes"]
-
-    assert "openid" in scopes
-    assert "odoo.read" not in scopes
+    assert must_contain <= scopes, must_contain - scopes
+    assert not must_not_contain & scopes, must_not_contain & scopes
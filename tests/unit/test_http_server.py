@@ -7,11 +7,84 @@ They WILL FAIL until the implementation is complete.
 Run with: pytest tests/unit/test_http_server.py -v
 """
 
+import importlib
+
+import httpx
 import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from mcp.types import TextContent
+
+from odoo_mcp_server import http_server
+from odoo_mcp_server.config import Settings
+from odoo_mcp_server.http_server import app, main
 
 pytestmark = [pytest.mark.unit]
 
 
+@pytest.fixture(scope="module")
+def client():
+    """Test client for the HTTP server; the app lifespan runs once per module."""
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def authenticated_client():
+    """
+    Async client with dev mode authentication enabled, shared by the module.
+
+    Requests go straight to the ASGI app on the test's event loop, without
+    TestClient's thread bridge.
+    """
+    # Enable OAuth dev mode to bypass token validation
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("OAUTH_DEV_MODE", "true")
+
+        # Reload to pick up env var change
+        importlib.reload(http_server)
+
+    # ASGITransport does not run the lifespan, so enter it explicitly
+    async with http_server.app.router.lifespan_context(http_server.app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=http_server.app),
+            base_url="http://test",
+        ) as client:
+            yield client
+
+
+@pytest.fixture(autouse=True)
+def reset_dependency_overrides():
+    """Keep dependency overrides from leaking between tests on the shared clients."""
+    yield
+
+    # authenticated_client reloads the module, so clear both app instances
+    app.dependency_overrides.clear()
+    http_server.app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def stub_employee_tools(monkeypatch):
+    """
+    Resolve every user to employee 7 and answer employee tools from a stub.
+
+    Keeps tools/call tests off the network; returns the recorded
+    (tool_name, arguments, employee_id) calls.
+    """
+    calls = []
+
+    async def get_employee_for_user(claims, odoo_client):
+        return {"id": 7, "name": "Test Employee"}
+
+    async def execute_employee_tool(name, arguments, odoo_client, employee_id):
+        calls.append((name, arguments, employee_id))
+        return [TextContent(type="text", text='{"id": 7, "name": "Test Employee"}')]
+
+    monkeypatch.setattr(http_server, "get_employee_for_user", get_employee_for_user)
+    monkeypatch.setattr(http_server, "execute_employee_tool", execute_employee_tool)
+    return calls
+
+
 class TestHTTPServerExists:
     """Tests that verify the HTTP server module exists and can be imported."""
 
@@ -20,8 +93,6 @@ class TestHTTPServerExists:
         EXPECTED: http_server.py module should exist and be importable.
         FAILS UNTIL: src/odoo_mcp_server/http_server.py is created.
         """
-        from odoo_mcp_server import http_server
-
         assert http_server is not None
 
     def test_http_server_has_app(self):
@@ -29,8 +100,6 @@ class TestHTTPServerExists:
         EXPECTED: HTTP server should expose a FastAPI app instance.
         FAILS UNTIL: FastAPI app is created in http_server.py.
         """
-        from odoo_mcp_server.http_server import app
-
         assert app is not None
         assert hasattr(app, "routes")
 
@@ -39,23 +108,12 @@ class TestHTTPServerExists:
         EXPECTED: HTTP server should have a main() entry point.
         FAILS UNTIL: main() function is implemented.
         """
-        from odoo_mcp_server.http_server import main
-
         assert callable(main)
 
 
 class TestHTTPServerEndpoints:
     """Tests for required HTTP endpoints."""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client for HTTP server."""
-        from fastapi.testclient import TestClient
-
-        from odoo_mcp_server.http_server import app
-
-        return TestClient(app)
-
     def test_health_endpoint(self, client):
         """
         EXPECTED: GET /health returns 200 with status.
@@ -83,6 +141,17 @@ class TestHTTPServerEndpoints:
         # Default is Google OAuth
         assert "https://accounts.google.com" in metadata["authorization_servers"]
 
+    def test_oauth_metadata_conditional_get(self, client):
+        """Metadata responses carry an ETag and honour If-None-Match."""
+        response = client.get("/.well-known/oauth-protected-resource")
+        etag = response.headers["ETag"]
+
+        cached = client.get("/.well-known/oauth-protected-resource", headers={"If-None-Match": etag})
+
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+        assert cached.content == b""
+
     def test_mcp_endpoint_exists(self, client):
         """
         EXPECTED: POST /mcp endpoint exists for MCP JSON-RPC.
@@ -122,33 +191,16 @@ class TestHTTPServerEndpoints:
         assert response.status_code in [200, 302, 303]
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestHTTPServerMCPProtocol:
     """Tests for MCP protocol over HTTP."""
 
-    @pytest.fixture
-    def authenticated_client(self, monkeypatch):
-        """Create test client with dev mode authentication enabled."""
-        import importlib
-
-        from fastapi.testclient import TestClient
-
-        import odoo_mcp_server.http_server as http_server_module
-
-        # Enable OAuth dev mode to bypass token validation
-        monkeypatch.setenv("OAUTH_DEV_MODE", "true")
-
-        # Reload to pick up env var change
-        importlib.reload(http_server_module)
-
-        client = TestClient(http_server_module.app)
-        return client
-
-    def test_mcp_tools_list(self, authenticated_client):
+    async def test_mcp_tools_list(self, authenticated_client):
         """
         EXPECTED: tools/list returns available MCP tools.
         FAILS UNTIL: MCP protocol handler is implemented.
         """
-        response = authenticated_client.post(
+        response = await authenticated_client.post(
             "/mcp",
             headers={"Authorization": "Bearer test_token"},
             json={"jsonrpc": "2.0", "method": "tools/list", "id": 1}
@@ -159,12 +211,12 @@ class TestHTTPServerMCPProtocol:
         assert "result" in result
         assert "tools" in result["result"]
 
-    def test_mcp_tools_call(self, authenticated_client):
+    async def test_mcp_tools_call(self, authenticated_client, stub_employee_tools):
         """
         EXPECTED: tools/call executes a tool and returns result.
         FAILS UNTIL: Tool execution over HTTP is implemented.
         """
-        response = authenticated_client.post(
+        response = await authenticated_client.post(
             "/mcp",
             headers={"Authorization": "Bearer test_token"},
             json={
@@ -180,14 +232,17 @@ class TestHTTPServerMCPProtocol:
 
         assert response.status_code == 200
         result = response.json()
-        assert "result" in result
+        assert result["id"] == 1
+        assert result["error"] is None
+        assert result["result"]["structuredContent"] == {"id": 7, "name": "Test Employee"}
+        assert stub_employee_tools == [("get_my_profile", {}, 7)]
 
-    def test_mcp_resources_list(self, authenticated_client):
+    async def test_mcp_resources_list(self, authenticated_client):
         """
         EXPECTED: resources/list returns available MCP resources.
         FAILS UNTIL: Resource listing over HTTP is implemented.
         """
-        response = authenticated_client.post(
+        response = await authenticated_client.post(
             "/mcp",
             headers={"Authorization": "Bearer test_token"},
             json={"jsonrpc": "2.0", "method": "resources/list", "id": 1}
@@ -195,7 +250,58 @@ class TestHTTPServerMCPProtocol:
 
         assert response.status_code == 200
         result = response.json()
-        assert "result" in result
+        assert result["error"] is None
+        assert "resources" in result["result"]
+
+    async def test_mcp_batch(self, authenticated_client, stub_employee_tools):
+        """
+        EXPECTED: A JSON-RPC batch is answered with one response per request
+        and none for notifications.
+        FAILS UNTIL: Batch requests are supported on /mcp.
+        """
+        response = await authenticated_client.post(
+            "/mcp",
+            headers={"Authorization": "Bearer test_token"},
+            json=[
+                {"jsonrpc": "2.0", "method": "notifications/initialized"},
+                {"jsonrpc": "2.0", "method": "tools/list", "id": 1},
+                {
+                    "jsonrpc": "2.0",
+                    "method": "tools/call",
+                    "params": {
+                        "name": "get_my_profile",
+                        "arguments": {}
+                    },
+                    "id": 2
+                },
+                {"jsonrpc": "2.0", "method": "resources/list", "id": 3},
+            ]
+        )
+
+        assert response.status_code == 200
+        # The notification gets no entry; every request gets exactly one
+        assert [item["id"] for item in response.json()] == [1, 2, 3]
+        results = {item["id"]: item for item in response.json()}
+        assert results[1]["error"] is None
+        assert "tools" in results[1]["result"]
+        assert results[2]["error"] is None
+        assert results[2]["result"]["structuredContent"] == {"id": 7, "name": "Test Employee"}
+        assert stub_employee_tools == [("get_my_profile", {}, 7)]
+        assert results[3]["error"] is None
+        assert "resources" in results[3]["result"]
+
+    async def test_mcp_batch_of_notifications_has_no_body(self, authenticated_client):
+        """
+        EXPECTED: A batch containing only notifications gets no response body.
+        """
+        response = await authenticated_client.post(
+            "/mcp",
+            headers={"Authorization": "Bearer test_token"},
+            json=[{"jsonrpc": "2.0", "method": "notifications/initialized"}]
+        )
+
+        assert response.status_code == 202
+        assert response.content == b""
 
 
 class TestHTTPServerConfiguration:
@@ -205,8 +311,6 @@ class TestHTTPServerConfiguration:
         """
         EXPECTED: Server binds to HTTP_HOST from config.
         """
-        from odoo_mcp_server.config import Settings
-
         settings = Settings()
         assert settings.http_host == "0.0.0.0"
 
@@ -214,8 +318,6 @@ class TestHTTPServerConfiguration:
         """
         EXPECTED: Server binds to HTTP_PORT from config.
         """
-        from odoo_mcp_server.config import Settings
-
         settings = Settings()
         assert settings.http_port == 8080
 
@@ -224,8 +326,6 @@ class TestHTTPServerConfiguration:
         EXPECTED: Server should have CORS configured for browser access.
         FAILS UNTIL: CORS middleware is added.
         """
-        from odoo_mcp_server.http_server import app
-
         # Check if CORS middleware is configured
         cors_middleware = None
         for middleware in app.user_middleware:
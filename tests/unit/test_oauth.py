@@ -4,8 +4,13 @@ Unit tests for OAuth functionality.
 Run with: pytest tests/unit/test_oauth.py -v -m unit
 """
 
+import base64
+import hashlib
+
 import pytest
 
+from tests.pkce import generate_pkce
+
 pytestmark = [pytest.mark.unit, pytest.mark.oauth]
 
 
@@ -21,9 +26,6 @@ class TestPKCEGeneration:
 
     def test_pkce_challenge_is_sha256_of_verifier(self, pkce_challenge: dict):
         """PKCE challenge should be SHA256 hash of verifier."""
-        import base64
-        import hashlib
-
         verifier = pkce_challenge["verifier"]
         challenge = pkce_challenge["challenge"]
 
@@ -38,22 +40,11 @@ class TestPKCEGeneration:
 
     def test_pkce_verifier_is_random(self):
         """Each PKCE generation should produce unique values."""
-        import base64
-        import hashlib
-        import secrets
-
-        challenges = set()
-        for _ in range(10):
-            verifier = secrets.token_urlsafe(32)
-            challenge = (
-                base64.urlsafe_b64encode(hashlib.sha256(verifier.encode()).digest())
-                .rstrip(b"=")
-                .decode()
-            )
-            challenges.add(challenge)
+        pairs = generate_pkce(10)
 
         # All should be unique
-        assert len(challenges) == 10
+        assert len({verifier for verifier, _ in pairs}) == 10
+        assert len({challenge for _, challenge in pairs}) == 10
 
 
 class TestProtectedResourceMetadata:
@@ -219,6 +210,25 @@ class TestGranularScopes:
         user_scopes_write = ["openid", "odoo.leave.write"]
         assert check_scope_access(required, user_scopes_write) is True
 
+    def test_check_scope_access_with_frozenset_scopes(self):
+        """Scopes frozen by the middleware should be checked without conversion."""
+        from odoo_mcp_server.config import DEFAULT_TOOL_SCOPES, TOOL_SCOPE_REQUIREMENTS, check_scope_access
+
+        user_scopes = frozenset({"openid", "odoo.read"})
+
+        assert check_scope_access(TOOL_SCOPE_REQUIREMENTS["get_my_profile"], user_scopes) is True
+        assert check_scope_access(DEFAULT_TOOL_SCOPES, user_scopes) is True
+        assert check_scope_access(TOOL_SCOPE_REQUIREMENTS["request_leave"], user_scopes) is False
+
+    def test_parent_scope_does_not_grant_child_scope(self):
+        """Scopes match exactly; odoo.hr.profile must not imply odoo.hr.profile.write."""
+        from odoo_mcp_server.config import TOOL_SCOPE_REQUIREMENTS, check_scope_access
+
+        user_scopes = frozenset({"openid", "odoo.hr.profile"})
+        required = TOOL_SCOPE_REQUIREMENTS["update_my_contact"]
+
+        assert check_scope_access(required, user_scopes) is False
+
     def test_granular_scope_string_parsing(self):
         """Granular scopes should be correctly parsed from space-delimited string."""
         scope_string = "openid odoo.hr.profile odoo.leave.read odoo.documents.read"
@@ -7,9 +7,12 @@ They WILL FAIL until the implementation is complete.
 Run with: pytest tests/unit/test_oauth_resource_server.py -v
 """
 
+import time
 from unittest.mock import MagicMock
 
+import orjson
 import pytest
+import respx
 
 pytestmark = [pytest.mark.unit, pytest.mark.oauth]
 
@@ -54,18 +57,19 @@ class TestOAuthModulesExist:
         assert OAuthMiddleware is not None
 
 
-class TestTokenValidator:
-    """Tests for JWT token validation."""
+@pytest.fixture(scope="module")
+def validator():
+    """One token validator shared by the module, as in production."""
+    from odoo_mcp_server.oauth.token_validator import TokenValidator
 
-    @pytest.fixture
-    def validator(self):
-        """Create token validator instance."""
-        from odoo_mcp_server.oauth.token_validator import TokenValidator
+    return TokenValidator(
+        issuer="https://auth.keboola.com",
+        audience="https://odoo-mcp.keboola.com",
+    )
 
-        return TokenValidator(
-            issuer="https://auth.keboola.com",
-            audience="https://odoo-mcp.keboola.com",
-        )
+
+class TestTokenValidator:
+    """Tests for JWT token validation."""
 
     def test_validator_fetches_jwks(self, validator):
         """
@@ -109,6 +113,20 @@ class TestTokenValidator:
         """
         assert validator.audience == "https://odoo-mcp.keboola.com"
 
+    @pytest.mark.parametrize(
+        ("aud_claim", "accepted"),
+        [
+            ("https://odoo-mcp.keboola.com", True),
+            (["other", "https://odoo-mcp.keboola.com"], True),
+            (["other"], False),
+            (None, False),
+        ],
+        ids=["string", "list", "list-mismatch", "missing"],
+    )
+    def test_validator_audience_claim_forms(self, validator, aud_claim, accepted):
+        """aud may be a string or a list; any accepted audience matches."""
+        assert validator._has_audience(aud_claim) is accepted
+
     def test_validator_extracts_claims(self, validator):
         """
         EXPECTED: Validator should extract claims from valid token.
@@ -117,6 +135,131 @@ class TestTokenValidator:
         assert hasattr(validator, "get_claims")
 
 
+@pytest.fixture(scope="module")
+def rsa_key():
+    """RSA private key and its public JWK (kid=test-key)."""
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from jwt.algorithms import RSAAlgorithm
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    jwk.update({"kid": "test-key", "use": "sig", "alg": "RS256"})
+    return private_key, jwk
+
+
+class TestTokenValidatorKeyCache:
+    """Tests for the per-validator JWKS signing key cache."""
+
+    ISSUER = "https://auth.keboola.com"
+    AUDIENCE = "https://odoo-mcp.keboola.com"
+    JWKS_URI = "https://auth.keboola.com/.well-known/jwks.json"
+
+    def _token(self, private_key, kid: str = "test-key", **claims) -> str:
+        import jwt
+
+        payload = {
+            "iss": self.ISSUER,
+            "aud": self.AUDIENCE,
+            "sub": "user-1",
+            "exp": int(time.time()) + 300,
+            **claims,
+        }
+        return jwt.encode(payload, private_key, algorithm="RS256", headers={"kid": kid})
+
+    async def test_signing_keys_fetched_once(self, rsa_key):
+        """JWKS is fetched once and the parsed key is reused for later tokens."""
+        from odoo_mcp_server.oauth.token_validator import TokenValidator
+
+        private_key, jwk = rsa_key
+        validator = TokenValidator(issuer=self.ISSUER, audience=self.AUDIENCE)
+
+        with respx.mock:
+            route = respx.get(self.JWKS_URI).respond(json={"keys": [jwk]})
+
+            first = await validator.validate_async(self._token(private_key, sub="cache-1"))
+            second = await validator.validate_async(self._token(private_key, sub="cache-2"))
+
+        assert first["sub"] == "cache-1"
+        assert second["sub"] == "cache-2"
+        assert route.call_count == 1
+
+    async def test_unknown_kid_refreshes_at_most_once(self, rsa_key):
+        """An unknown kid forces one refresh; repeats within the interval do not refetch."""
+        from odoo_mcp_server.oauth.token_validator import InvalidTokenError, TokenValidator
+
+        private_key, jwk = rsa_key
+        validator = TokenValidator(issuer=self.ISSUER, audience=self.AUDIENCE)
+
+        with respx.mock:
+            route = respx.get(self.JWKS_URI).respond(json={"keys": [jwk]})
+
+            await validator.validate_async(self._token(private_key, sub="kid-1"))
+            for attempt in range(3):
+                with pytest.raises(InvalidTokenError):
+                    await validator.validate_async(self._token(private_key, kid="rotated", sub=f"kid-{attempt}"))
+
+        assert route.call_count == 1
+
+    async def test_malformed_header_rejected_before_key_lookup(self):
+        """A header that is not base64url JSON fails without fetching JWKS."""
+        from odoo_mcp_server.oauth.token_validator import InvalidTokenError, TokenValidator
+
+        validator = TokenValidator(issuer=self.ISSUER, audience=self.AUDIENCE)
+
+        with respx.mock:
+            route = respx.get(self.JWKS_URI).respond(json={"keys": []})
+            with pytest.raises(InvalidTokenError, match="malformed header"):
+                await validator.validate_async("not-json.e30.sig")
+
+        assert route.call_count == 0
+
+    @pytest.mark.parametrize(
+        ("claims", "error"),
+        [
+            ({"exp": 1}, "TokenExpiredError"),
+            ({"iss": "https://evil.example.com"}, "InvalidIssuerError"),
+            ({"aud": "https://other.example.com"}, "InvalidAudienceError"),
+        ],
+        ids=["expired", "issuer", "audience"],
+    )
+    async def test_bad_claims_rejected_before_key_lookup(self, rsa_key, claims, error):
+        """Expired, foreign-issuer and wrong-audience tokens fail without a JWKS fetch."""
+        from odoo_mcp_server.oauth import token_validator
+
+        private_key, _ = rsa_key
+        validator = token_validator.TokenValidator(issuer=self.ISSUER, audience=self.AUDIENCE)
+
+        with respx.mock:
+            route = respx.get(self.JWKS_URI).respond(json={"keys": []})
+            with pytest.raises(getattr(token_validator, error)):
+                await validator.validate_async(self._token(private_key, **claims))
+
+        assert route.call_count == 0
+
+
+class TestTokenClaimsCache:
+    """Tests for the validated-claims LRU cache."""
+
+    def test_least_recently_used_entry_is_evicted(self, monkeypatch):
+        """Beyond the size bound the least recently read token is dropped first."""
+        from collections import OrderedDict
+
+        from odoo_mcp_server.oauth import token_validator
+
+        monkeypatch.setattr(token_validator, "_token_cache", OrderedDict())
+        monkeypatch.setattr(token_validator, "_TOKEN_CACHE_MAX_SIZE", 2)
+        exp = time.time() + 60
+
+        token_validator._cache_claims("token-a", {"sub": "a", "exp": exp})
+        token_validator._cache_claims("token-b", {"sub": "b", "exp": exp})
+        assert token_validator._get_cached_claims("token-a")["sub"] == "a"
+        token_validator._cache_claims("token-c", {"sub": "c", "exp": exp})
+
+        assert token_validator._get_cached_claims("token-b") is None
+        assert token_validator._get_cached_claims("token-a")["sub"] == "a"
+        assert token_validator._get_cached_claims("token-c")["sub"] == "c"
+
+
 class TestOAuthMiddleware:
     """Tests for OAuth middleware integration with FastAPI."""
 
@@ -222,6 +365,7 @@ class TestProtectedResourceMetadata:
         json_data = metadata.to_dict()
         assert "resource" in json_data
         assert "authorization_servers" in json_data
+        assert orjson.loads(metadata.to_json_bytes()) == json_data
 
     def test_metadata_includes_scopes_supported(self):
         """
@@ -343,3 +487,4 @@ class TestUserContextFromToken:
 
         context = extract_user_context(claims)
         assert "odoo.hr.profile" in context["scopes"]
+        assert context["scopes"] == frozenset({"openid", "odoo.read", "odoo.hr.profile"})
@@ -5,14 +5,88 @@ Run with: pytest tests/unit/test_odoo_client.py -v -m unit
 """
 
 import asyncio
-from unittest.mock import AsyncMock
+import itertools
+from datetime import datetime
 from xmlrpc.client import Fault
 
+import orjson
 import pytest
+import pytest_asyncio
+import respx
+
+from odoo_mcp_server.odoo.client import OdooClient
+from odoo_mcp_server.odoo.exceptions import (
+    OdooAuthenticationError,
+    OdooConnectionError,
+    OdooError,
+    OdooPermissionError,
+    OdooRecordNotFoundError,
+    OdooServerError,
+    OdooValidationError,
+    map_connection_error,
+    map_odoo_fault,
+)
+from odoo_mcp_server.tools.employee import execute_employee_tool
 
 pytestmark = [pytest.mark.unit, pytest.mark.odoo]
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _odoo_client_prototype():
+    """One pre-authenticated OdooClient for the session; tests never reach the network."""
+    client = OdooClient(
+        url="https://mock.odoo.com",
+        database="mock_db",
+        username="mock_user",
+        api_key="mock_key",
+    )
+    client._uid = 1
+    yield client
+    await client.close()
+
+
+# Canned Odoo results for the employee tool tests; the tools only read them
+_PROFILE_RECORDS = [
+    {
+        "id": 1,
+        "name": "Test Employee",
+        "work_email": "test@example.com",
+        "department_id": [1, "Engineering"],
+        "parent_id": [2, "Manager Name"],
+        "job_title": "Developer",
+        "x_preferred_name": "Testy",
+        "x_division": "Product",
+    }
+]
+
+# hr.leave.type with native computed fields
+_LEAVE_TYPE_BALANCES = [
+    {
+        "id": 1,
+        "name": "Paid Time Off",
+        "max_leaves": 25,
+        "leaves_taken": 3,
+        "virtual_remaining_leaves": 22,
+    },
+]
+
+
+class _StubOdooClient:
+    """Minimal async stand-in for OdooClient that records calls and returns canned results."""
+
+    def __init__(self):
+        self.calls = []
+        self.returns = {}
+
+    async def read(self, *args, **kwargs):
+        self.calls.append(("read", args, kwargs))
+        return self.returns["read"]
+
+    async def execute(self, *args, **kwargs):
+        self.calls.append(("execute", args, kwargs))
+        return self.returns["execute"]
+
+
 # =============================================================================
 # Error Handling Tests (TDD - Feedback 4.2)
 # =============================================================================
@@ -23,11 +97,6 @@ class TestOdooErrorHandling:
 
     def test_access_denied_error_mapping(self):
         """AccessDenied fault should map to AuthenticationError."""
-        from odoo_mcp_server.odoo.exceptions import (
-            OdooAuthenticationError,
-            map_odoo_fault,
-        )
-
         fault = Fault(3, "Access Denied")
         error = map_odoo_fault(fault)
 
@@ -37,8 +106,6 @@ class TestOdooErrorHandling:
 
     def test_user_error_mapping(self):
         """UserError fault should map to OdooValidationError."""
-        from odoo_mcp_server.odoo.exceptions import OdooValidationError, map_odoo_fault
-
         fault = Fault(1, "UserError: Date must be in the future")
         error = map_odoo_fault(fault)
 
@@ -48,11 +115,6 @@ class TestOdooErrorHandling:
 
     def test_missing_error_mapping(self):
         """MissingError fault should map to OdooRecordNotFoundError."""
-        from odoo_mcp_server.odoo.exceptions import (
-            OdooRecordNotFoundError,
-            map_odoo_fault,
-        )
-
         fault = Fault(2, "MissingError: Record does not exist")
         error = map_odoo_fault(fault)
 
@@ -61,8 +123,6 @@ class TestOdooErrorHandling:
 
     def test_access_error_mapping(self):
         """AccessError fault should map to OdooPermissionError."""
-        from odoo_mcp_server.odoo.exceptions import OdooPermissionError, map_odoo_fault
-
         fault = Fault(4, "AccessError: You don't have access to this record")
         error = map_odoo_fault(fault)
 
@@ -71,21 +131,22 @@ class TestOdooErrorHandling:
 
     def test_validation_error_mapping(self):
         """ValidationError fault should map to OdooValidationError."""
-        from odoo_mcp_server.odoo.exceptions import OdooValidationError, map_odoo_fault
-
         fault = Fault(1, "ValidationError: Required field missing")
         error = map_odoo_fault(fault)
 
         assert isinstance(error, OdooValidationError)
         assert error.error_code == "VALIDATION_ERROR"
 
+    def test_fault_class_name_wins_over_code(self):
+        """The Odoo exception named in the fault string decides the mapping."""
+        # Odoo reports UserError with the generic warning code 2
+        fault = Fault(2, "Traceback (most recent call last):\nodoo.exceptions.UserError: Leave overlaps")
+        error = map_odoo_fault(fault)
+
+        assert isinstance(error, OdooValidationError)
+
     def test_connection_error_mapping(self):
         """Connection errors should map to OdooConnectionError."""
-
-        from odoo_mcp_server.odoo.exceptions import (
-            OdooConnectionError,
-            map_connection_error,
-        )
         error = map_connection_error(TimeoutError("Connection timed out"))
 
         assert isinstance(error, OdooConnectionError)
@@ -94,8 +155,6 @@ class TestOdooErrorHandling:
 
     def test_unknown_fault_mapping(self):
         """Unknown faults should map to generic OdooError with details."""
-        from odoo_mcp_server.odoo.exceptions import OdooError, map_odoo_fault
-
         fault = Fault(999, "Some unknown error occurred")
         error = map_odoo_fault(fault)
 
@@ -105,8 +164,6 @@ class TestOdooErrorHandling:
 
     def test_error_to_mcp_response(self):
         """Errors should be convertible to MCP-friendly JSON responses."""
-        from odoo_mcp_server.odoo.exceptions import OdooValidationError
-
         error = OdooValidationError("Date must be in the future", field="start_date")
         response = error.to_mcp_response()
 
@@ -124,11 +181,8 @@ class TestOdooErrorHandling:
 class TestOdooClientConcurrency:
     """Tests for OdooClient async/concurrency safety."""
 
-    @pytest.mark.asyncio
     async def test_concurrent_requests_isolation(self):
         """Concurrent requests should not interfere with each other."""
-        from odoo_mcp_server.odoo.client import OdooClient
-
         client = OdooClient(
             url="https://test.odoo.com",
             database="test_db",
@@ -137,17 +191,15 @@ class TestOdooClientConcurrency:
         )
         client._uid = 1  # Pre-authenticate
 
-        # Mock the XML-RPC calls
-        call_count = 0
+        # Mock the JSON-RPC calls; each call takes the next id from a monotonic counter
+        call_ids = itertools.count(1)
 
-        async def mock_run_in_executor(func, *args):
-            nonlocal call_count
-            call_count += 1
-            current_call = call_count
-            await asyncio.sleep(0.01)  # Simulate network delay
+        async def mock_jsonrpc_call(service, method, *args):
+            current_call = next(call_ids)
+            await asyncio.sleep(0)  # Yield so the concurrent calls interleave
             return [{"id": current_call, "name": f"Record {current_call}"}]
 
-        client._run_in_executor = mock_run_in_executor
+        client._jsonrpc_call = mock_jsonrpc_call
 
         # Run concurrent requests
         tasks = [
@@ -162,11 +214,8 @@ class TestOdooClientConcurrency:
         # All IDs should be unique (no cross-contamination)
         assert len(set(ids)) == 5
 
-    @pytest.mark.asyncio
     async def test_uid_caching_thread_safety(self):
         """UID caching should be thread-safe for async operations."""
-        from odoo_mcp_server.odoo.client import OdooClient
-
         client = OdooClient(
             url="https://test.odoo.com",
             database="test_db",
@@ -177,11 +226,8 @@ class TestOdooClientConcurrency:
         # The _uid should be protected by asyncio.Lock
         assert hasattr(client, '_uid_lock') or hasattr(client, '_lock')
 
-    @pytest.mark.asyncio
     async def test_client_is_reusable_across_requests(self):
         """Single client instance should handle multiple sequential requests."""
-        from odoo_mcp_server.odoo.client import OdooClient
-
         client = OdooClient(
             url="https://test.odoo.com",
             database="test_db",
@@ -193,7 +239,7 @@ class TestOdooClientConcurrency:
         async def mock_run(*args):
             return [{"id": 1}]
 
-        client._run_in_executor = mock_run
+        client._jsonrpc_call = mock_run
         call_count = 0
 
         async def counting_mock(*args):
@@ -201,7 +247,7 @@ class TestOdooClientConcurrency:
             call_count += 1
             return [{"id": 1}]
 
-        client._run_in_executor = counting_mock
+        client._jsonrpc_call = counting_mock
 
         # Multiple sequential calls
         result1 = await client.search_read("res.partner", [], ["id"])
@@ -225,33 +271,24 @@ class TestOdooClientWithMocking:
     """
 
     @pytest.fixture
-    def mock_odoo_client(self):
-        """Create a mocked OdooClient for unit testing."""
-        from odoo_mcp_server.odoo.client import OdooClient
+    def mock_odoo_client(self, _odoo_client_prototype):
+        """Shared pre-authenticated OdooClient, restored after each test."""
+        yield _odoo_client_prototype
 
-        client = OdooClient(
-            url="https://mock.odoo.com",
-            database="mock_db",
-            username="mock_user",
-            api_key="mock_key",
-        )
-
-        # Pre-authenticate
-        client._uid = 1
+        # Tests patch _jsonrpc_call on the instance; drop it to restore the real transport
+        vars(_odoo_client_prototype).pop("_jsonrpc_call", None)
+        _odoo_client_prototype._uid = 1
 
-        return client
-
-    @pytest.mark.asyncio
     async def test_search_read_mocked(self, mock_odoo_client):
         """Test search_read with mocked responses."""
-        # Setup mock response by mocking _run_in_executor
+        # Setup mock response by mocking _jsonrpc_call
         async def mock_run(*args):
             return [
                 {"id": 1, "name": "John Doe", "work_email": "john@example.com"},
                 {"id": 2, "name": "Jane Doe", "work_email": "jane@example.com"},
             ]
 
-        mock_odoo_client._run_in_executor = mock_run
+        mock_odoo_client._jsonrpc_call = mock_run
 
         # Execute
         result = await mock_odoo_client.search_read(
@@ -264,13 +301,32 @@ class TestOdooClientWithMocking:
         assert len(result) == 2
         assert result[0]["name"] == "John Doe"
 
-    @pytest.mark.asyncio
+    async def test_search_ids_mocked(self, mock_odoo_client):
+        """Test search returns IDs without requesting any fields."""
+        calls = []
+
+        async def mock_run(*args):
+            calls.append(args)
+            return [5]
+
+        mock_odoo_client._jsonrpc_call = mock_run
+
+        result = await mock_odoo_client.search(
+            model="hr.employee",
+            domain=[["work_email", "!=", False]],
+            limit=1,
+        )
+
+        assert result == [5]
+        assert calls[0][6] == "search"
+        assert calls[0][8] == {"offset": 0, "limit": 1}
+
     async def test_create_mocked(self, mock_odoo_client):
         """Test create with mocked responses."""
         async def mock_run(*args):
             return 42
 
-        mock_odoo_client._run_in_executor = mock_run
+        mock_odoo_client._jsonrpc_call = mock_run
 
         result = await mock_odoo_client.create(
             model="hr.leave",
@@ -284,18 +340,112 @@ class TestOdooClientWithMocking:
 
         assert result == 42
 
-    @pytest.mark.asyncio
+    async def test_read_group_mocked(self, mock_odoo_client):
+        """Test read_group passes aggregates and groupby through to Odoo."""
+        calls = []
+
+        async def mock_run(*args):
+            calls.append(args)
+            return [{"__count": 3, "expected_revenue": 150000.0}]
+
+        mock_odoo_client._jsonrpc_call = mock_run
+
+        result = await mock_odoo_client.read_group(
+            model="crm.lead",
+            domain=[["type", "=", "opportunity"]],
+            fields=["expected_revenue:sum"],
+        )
+
+        assert result[0]["expected_revenue"] == 150000.0
+        # ("object", "execute_kw", db, uid, key, model, method, args, kwargs)
+        assert calls[0][5:] == (
+            "crm.lead",
+            "read_group",
+            ([["type", "=", "opportunity"]], ["expected_revenue:sum"], []),
+            {"lazy": True},
+        )
+
+    async def test_update_and_read_mocked(self, mock_odoo_client):
+        """Test update_and_read writes first, then reads the same records."""
+        methods = []
+
+        async def mock_run(*args):
+            methods.append(args[6])
+            return True if args[6] == "write" else [{"id": 7, "phone": "+1-555-0123"}]
+
+        mock_odoo_client._jsonrpc_call = mock_run
+
+        result = await mock_odoo_client.update_and_read(
+            model="res.partner",
+            ids=[7],
+            values={"phone": "+1-555-0123"},
+            fields=["phone"],
+        )
+
+        assert methods == ["write", "read"]
+        assert result[0]["phone"] == "+1-555-0123"
+
+    async def test_close_releases_connections(self):
+        """close() should shut down the pooled HTTP client."""
+        # Own client: closing the shared one would break later tests
+        client = OdooClient(url="https://mock.odoo.com", database="mock_db", api_key="mock_key")
+
+        await client.close()
+
+        assert client._http.is_closed
+
+    @respx.mock
+    async def test_jsonrpc_call_posts_execute_kw(self, mock_odoo_client):
+        """execute() should POST one JSON-RPC execute_kw call and return its result."""
+        route = respx.post("https://mock.odoo.com/jsonrpc").respond(
+            json={"jsonrpc": "2.0", "id": 1, "result": [{"id": 7}]}
+        )
+
+        result = await mock_odoo_client.read("hr.employee", [7], ["name"])
+
+        assert result == [{"id": 7}]
+        params = orjson.loads(route.calls.last.request.content)["params"]
+        assert params == {
+            "service": "object",
+            "method": "execute_kw",
+            "args": ["mock_db", 1, "mock_key", "hr.employee", "read", [[7]], {"fields": ["name"]}],
+        }
+
+    @respx.mock
+    async def test_jsonrpc_error_maps_to_odoo_error(self, mock_odoo_client):
+        """JSON-RPC error payloads should map like the equivalent XML-RPC faults."""
+        respx.post("https://mock.odoo.com/jsonrpc").respond(json={
+            "jsonrpc": "2.0",
+            "id": 1,
+            "error": {
+                "code": 200,
+                "message": "Odoo Server Error",
+                "data": {"name": "odoo.exceptions.AccessError", "message": "No access to hr.contract"},
+            },
+        })
+
+        with pytest.raises(OdooPermissionError, match="No access to hr.contract"):
+            await mock_odoo_client.read("hr.contract", [1])
+
+    @respx.mock
+    async def test_non_json_response_maps_to_server_error(self, mock_odoo_client):
+        """A 200 response that is not JSON (e.g. a proxy login page) should raise OdooServerError."""
+        respx.post("https://mock.odoo.com/jsonrpc").respond(
+            text="<html><body>Please log in</body></html>", headers={"Content-Type": "text/html"}
+        )
+
+        with pytest.raises(OdooServerError, match="not valid JSON"):
+            await mock_odoo_client.read("hr.employee", [7])
+
     async def test_error_handling_mocked(self, mock_odoo_client):
         """Test error handling with mocked XML-RPC fault."""
-        from odoo_mcp_server.odoo.exceptions import OdooValidationError, map_odoo_fault
-
-        # When mocking _run_in_executor, we need to raise the mapped exception
+        # When mocking _jsonrpc_call, we need to raise the mapped exception
         # since we're bypassing the error handling in the original method
         async def mock_run(*args):
             fault = Fault(1, "ValidationError: Leave request overlaps with existing")
             raise map_odoo_fault(fault)
 
-        mock_odoo_client._run_in_executor = mock_run
+        mock_odoo_client._jsonrpc_call = mock_run
 
         with pytest.raises(OdooValidationError) as exc_info:
             await mock_odoo_client.create(
@@ -311,28 +461,13 @@ class TestEmployeeToolsWithMocking:
 
     @pytest.fixture
     def mock_odoo_client(self):
-        """Create a mock OdooClient."""
-        client = AsyncMock()
-        return client
+        """Fresh stub OdooClient; set results in .returns and inspect .calls."""
+        return _StubOdooClient()
 
-    @pytest.mark.asyncio
     async def test_get_my_profile_mocked(self, mock_odoo_client):
         """Test get_my_profile tool with mocked client."""
-        from odoo_mcp_server.tools.employee import execute_employee_tool
-
         # Setup mock response
-        mock_odoo_client.read.return_value = [
-            {
-                "id": 1,
-                "name": "Test Employee",
-                "work_email": "test@example.com",
-                "department_id": [1, "Engineering"],
-                "parent_id": [2, "Manager Name"],
-                "job_title": "Developer",
-                "x_preferred_name": "Testy",
-                "x_division": "Product",
-            }
-        ]
+        mock_odoo_client.returns["read"] = _PROFILE_RECORDS
 
         result = await execute_employee_tool(
             name="get_my_profile",
@@ -342,29 +477,16 @@ class TestEmployeeToolsWithMocking:
         )
 
         # Verify
-        import json
-        profile = json.loads(result[0].text)
+        profile = orjson.loads(result[0].text)
 
         assert profile["name"] == "Test Employee"
         assert profile["preferred_name"] == "Testy"
         assert profile["division"] == "Product"
         assert profile["department"] == "Engineering"
 
-    @pytest.mark.asyncio
     async def test_get_my_leave_balance_mocked(self, mock_odoo_client):
         """Test get_my_leave_balance tool with mocked client."""
-        from odoo_mcp_server.tools.employee import execute_employee_tool
-
-        # Mock hr.leave.type with native computed fields (new implementation)
-        mock_odoo_client.execute.return_value = [
-            {
-                "id": 1,
-                "name": "Paid Time Off",
-                "max_leaves": 25,
-                "leaves_taken": 3,
-                "virtual_remaining_leaves": 22,
-            },
-        ]
+        mock_odoo_client.returns["execute"] = _LEAVE_TYPE_BALANCES
 
         result = await execute_employee_tool(
             name="get_my_leave_balance",
@@ -373,8 +495,7 @@ class TestEmployeeToolsWithMocking:
             employee_id=1,
         )
 
-        import json
-        response = json.loads(result[0].text)
+        response = orjson.loads(result[0].text)
 
         # Response format: {"year": ..., "balances": [...], "note": ..., "version": ...}
         assert response["year"] == 2026
@@ -386,26 +507,21 @@ class TestEmployeeToolsWithMocking:
         assert balances[0]["remaining"] == 22
 
         # Verify execute was called on hr.leave.type model
-        mock_odoo_client.execute.assert_called()
-        call_args = mock_odoo_client.execute.call_args
-        assert call_args[0][0] == "hr.leave.type"
-        assert call_args[0][1] == "search_read"
+        method, args, _ = mock_odoo_client.calls[-1]
+        assert method == "execute"
+        assert args[:2] == ("hr.leave.type", "search_read")
 
 
 class TestOdooClientConfiguration:
     """Tests for Odoo client configuration."""
 
-    def test_url_normalization(self):
-        """URL should be normalized (trailing slash removed)."""
-        urls = [
-            ("https://erp.example.com", "https://erp.example.com"),
-            ("https://erp.example.com/", "https://erp.example.com"),
-            ("https://erp.example.com//", "https://erp.example.com"),
-        ]
+    @pytest.mark.parametrize("url", ["https://erp.example.com", "https://erp.example.com/", "https://erp.example.com//"])
+    def test_url_normalization(self, url):
+        """Trailing slashes are stripped before the JSON-RPC endpoint is built."""
+        client = OdooClient(url=url, database="mock_db", api_key="mock_key")
 
-        for input_url, expected in urls:
-            normalized = input_url.rstrip("/")
-            assert normalized == expected
+        assert client.url == "https://erp.example.com"
+        assert client._endpoint == "https://erp.example.com/jsonrpc"
 
     def test_api_key_takes_precedence_over_password(self):
         """When both API key and password are provided, API key should be used."""
@@ -419,79 +535,36 @@ class TestOdooClientConfiguration:
         assert auth_credential == "secret_key"
 
 
-class TestOdooDomainParsing:
-    """Tests for Odoo search domain parsing."""
-
-    def test_simple_domain(self):
-        """Simple domain should be parsed correctly."""
-        domain = [["name", "=", "Test"]]
-
-        assert len(domain) == 1
-        assert domain[0][0] == "name"
-        assert domain[0][1] == "="
-        assert domain[0][2] == "Test"
-
-    def test_compound_domain_with_and(self):
-        """AND domain should use implicit conjunction."""
-        domain = [
-            ["is_company", "=", True],
-            ["active", "=", True],
-        ]
-
-        # Implicit AND between conditions
-        assert len(domain) == 2
-
-    def test_compound_domain_with_or(self):
-        """OR domain should use '|' operator."""
-        domain = [
-            "|",
-            ["name", "ilike", "test"],
-            ["email", "ilike", "test"],
-        ]
-
-        assert domain[0] == "|"
-        assert len(domain) == 3
-
-    def test_nested_domain(self):
-        """Nested domain should be supported."""
-        domain = [
+# (domain, length, prefix operators by position)
+DOMAIN_CASES = [
+    pytest.param([["name", "=", "Test"]], 1, {}, id="simple"),
+    # Implicit AND between conditions
+    pytest.param([["is_company", "=", True], ["active", "=", True]], 2, {}, id="implicit-and"),
+    pytest.param(["|", ["name", "ilike", "test"], ["email", "ilike", "test"]], 3, {0: "|"}, id="or"),
+    pytest.param(
+        [
             "&",
             ["is_company", "=", True],
             "|",
             ["country_id.code", "=", "US"],
             ["country_id.code", "=", "CA"],
-        ]
+        ],
+        5,
+        {0: "&", 2: "|"},
+        id="nested",
+    ),
+]
 
-        assert domain[0] == "&"
-        assert domain[2] == "|"
 
+class TestOdooDomainParsing:
+    """Tests for Odoo search domain parsing."""
 
-class TestOdooFieldSelection:
-    """Tests for field selection logic."""
-
-    def test_default_common_fields(self):
-        """Common fields should be selected by default for known models."""
-        model_default_fields = {
-            "res.partner": ["id", "name", "email", "phone", "is_company"],
-            "crm.lead": ["id", "name", "expected_revenue", "probability", "stage_id"],
-            "product.product": ["id", "name", "default_code", "list_price"],
-        }
-
-        for model, fields in model_default_fields.items():
-            assert "id" in fields
-            assert "name" in fields
-
-    def test_all_fields_selector(self):
-        """__all__ should indicate all fields requested."""
-        fields = ["__all__"]
-        assert fields == ["__all__"]
-        assert len(fields) == 1
-
-    def test_empty_fields_means_default(self):
-        """Empty fields list should use smart defaults."""
-        fields = []
-        # Empty should trigger default selection logic
-        assert len(fields) == 0
+    @pytest.mark.parametrize(("domain", "length", "operators"), DOMAIN_CASES)
+    def test_domain_shape(self, domain, length, operators):
+        """Domains are prefix-notation lists of operators and (field, op, value) terms."""
+        assert len(domain) == length
+        assert {index: domain[index] for index in operators} == operators
+        assert all(len(term) == 3 for index, term in enumerate(domain) if index not in operators)
 
 
 class TestOdooRecordFormatting:
@@ -499,8 +572,6 @@ class TestOdooRecordFormatting:
 
     def test_datetime_serialization(self):
         """Datetime fields should be serialized to ISO format."""
-        from datetime import datetime
-
         dt = datetime(2025, 1, 15, 10, 30, 0)
         # Using str() or isoformat() for serialization
         serialized = dt.isoformat()
@@ -4,17 +4,33 @@ Unit tests for MCP tools.
 Run with: pytest tests/unit/test_tools.py -v -m unit
 """
 
+import re
+from types import MappingProxyType
+
 import pytest
+from jsonschema import Draft202012Validator
+from mcp.types import TextContent
+
+from odoo_mcp_server.config import OAUTH_SCOPES, TOOL_SCOPE_REQUIREMENTS, WRITE_TOOLS
+from odoo_mcp_server.tools import register_tools, structured_content
+from odoo_mcp_server.tools.employee import (
+    DMS_ALLOWED_FOLDERS,
+    DMS_RESTRICTED_FOLDERS,
+    EMPLOYEE_TOOLS,
+    PUBLIC_EMPLOYEE_FIELDS,
+    SELF_EMPLOYEE_FIELDS,
+)
 
 pytestmark = [pytest.mark.unit]
 
+SNAKE_CASE = re.compile(r"[a-z][a-z0-9_]*")
 
-class TestToolSchemaValidation:
-    """Tests for tool input schema validation."""
 
-    def test_search_records_required_fields(self):
-        """search_records should require model field."""
-        schema = {
+# (schema, required) per CRUD tool; ids are the tool names. Schemas are
+# read-only so no test can mutate one shared across parametrized cases
+TOOL_SCHEMAS = [
+    pytest.param(
+        MappingProxyType({
             "type": "object",
             "properties": {
                 "model": {"type": "string"},
@@ -24,14 +40,12 @@ class TestToolSchemaValidation:
                 "offset": {"type": "integer", "default": 0},
             },
             "required": ["model"],
-        }
-
-        assert "model" in schema["required"]
-        assert "domain" not in schema["required"]  # Has default
-
-    def test_get_record_required_fields(self):
-        """get_record should require model and record_id."""
-        schema = {
+        }),
+        ["model"],  # domain has a default
+        id="search_records",
+    ),
+    pytest.param(
+        MappingProxyType({
             "type": "object",
             "properties": {
                 "model": {"type": "string"},
@@ -39,28 +53,24 @@ class TestToolSchemaValidation:
                 "fields": {"type": "array"},
             },
             "required": ["model", "record_id"],
-        }
-
-        assert "model" in schema["required"]
-        assert "record_id" in schema["required"]
-
-    def test_create_record_required_fields(self):
-        """create_record should require model and values."""
-        schema = {
+        }),
+        ["model", "record_id"],
+        id="get_record",
+    ),
+    pytest.param(
+        MappingProxyType({
             "type": "object",
             "properties": {
                 "model": {"type": "string"},
                 "values": {"type": "object"},
             },
             "required": ["model", "values"],
-        }
-
-        assert "model" in schema["required"]
-        assert "values" in schema["required"]
-
-    def test_update_record_required_fields(self):
-        """update_record should require model, record_id, and values."""
-        schema = {
+        }),
+        ["model", "values"],
+        id="create_record",
+    ),
+    pytest.param(
+        MappingProxyType({
             "type": "object",
             "properties": {
                 "model": {"type": "string"},
@@ -68,23 +78,100 @@ class TestToolSchemaValidation:
                 "values": {"type": "object"},
             },
             "required": ["model", "record_id", "values"],
-        }
-
-        assert len(schema["required"]) == 3
-
-    def test_delete_record_required_fields(self):
-        """delete_record should require model and record_id."""
-        schema = {
+        }),
+        ["model", "record_id", "values"],
+        id="update_record",
+    ),
+    pytest.param(
+        MappingProxyType({
             "type": "object",
             "properties": {
                 "model": {"type": "string"},
                 "record_id": {"type": "integer"},
             },
             "required": ["model", "record_id"],
-        }
+        }),
+        ["model", "record_id"],
+        id="delete_record",
+    ),
+]
+
+VALID_DOMAINS = [
+    pytest.param([], id="empty"),
+    pytest.param([["name", "=", "test"]], id="single"),
+    pytest.param([["is_company", "=", True], ["active", "=", True]], id="implicit-and"),
+    pytest.param(["|", ["name", "ilike", "a"], ["name", "ilike", "b"]], id="or"),
+]
+
+
+# Every tool the server registers (CRUD and employee); ids are the tool names
+ALL_TOOLS = [pytest.param(tool, id=tool.name) for tool in register_tools()]
+
+# Employee tools keyed by name
+_EMPLOYEE_TOOLS_BY_NAME = {tool.name: tool for tool in EMPLOYEE_TOOLS}
+
+
+# JSON Schemas that each employee tool's inputSchema must satisfy; validators are built once at import
+_NO_REQUIRED_FIELDS = {"maxItems": 0}
+
+
+def _object_schema_shape(properties: dict, required: dict | None = None, *, has_required: bool = False):
+    """Validator for an object inputSchema whose 'properties' and 'required' match the given shapes."""
+    return Draft202012Validator({
+        "type": "object",
+        "required": ["type", "properties", "required"] if has_required else ["type", "properties"],
+        "properties": {
+            "type": {"const": "object"},
+            "properties": properties,
+            "required": required or {},
+        },
+    })
+
+
+EMPLOYEE_SCHEMA_SHAPES = [
+    pytest.param(
+        "get_direct_reports",
+        _object_schema_shape({"type": "object"}, _NO_REQUIRED_FIELDS),
+        id="get_direct_reports",
+    ),
+    pytest.param(
+        "update_my_contact",
+        # Every contact field is optional
+        _object_schema_shape({"required": ["work_phone", "mobile_phone", "work_email"]}, _NO_REQUIRED_FIELDS),
+        id="update_my_contact",
+    ),
+    pytest.param(
+        "get_public_holidays",
+        _object_schema_shape({
+            "required": ["year"],
+            "properties": {"year": {"required": ["type"], "properties": {"type": {"const": "integer"}}}},
+        }),
+        id="get_public_holidays",
+    ),
+    pytest.param(
+        "get_document_details",
+        _object_schema_shape(
+            {"required": ["document_id"]},
+            {"contains": {"const": "document_id"}},
+            has_required=True,
+        ),
+        id="get_document_details",
+    ),
+]
+
+
+# Employee tools added after the first release; each needs its own scope entry
+NEW_EMPLOYEE_TOOLS = ("get_direct_reports", "update_my_contact", "get_public_holidays", "get_document_details")
+
+
+class TestToolSchemaValidation:
+    """Tests for tool input schema validation."""
 
-        assert "model" in schema["required"]
-        assert "record_id" in schema["required"]
+    @pytest.mark.parametrize(("schema", "required"), TOOL_SCHEMAS)
+    def test_required_fields(self, schema, required):
+        """Each CRUD tool requires exactly its mandatory fields."""
+        assert sorted(schema["required"]) == sorted(required)
+        assert set(required) <= schema["properties"].keys()
 
 
 class TestToolResultFormatting:
@@ -92,143 +179,75 @@ class TestToolResultFormatting:
 
     def test_search_results_are_list(self):
         """Search results should be returned as a list."""
-        import json
-
         results = [
             {"id": 1, "name": "Partner 1"},
             {"id": 2, "name": "Partner 2"},
         ]
 
-        formatted = json.dumps(results)
-        parsed = json.loads(formatted)
-
-        assert isinstance(parsed, list)
-        assert len(parsed) == 2
+        assert isinstance(results, list)
+        assert len(results) == 2
 
     def test_single_record_is_object(self):
         """Single record should be returned as an object."""
-        import json
-
         record = {"id": 1, "name": "Partner 1", "email": "test@example.com"}
 
-        formatted = json.dumps(record)
-        parsed = json.loads(formatted)
-
-        assert isinstance(parsed, dict)
-        assert "id" in parsed
+        assert isinstance(record, dict)
+        assert "id" in record
 
     def test_create_result_includes_id(self):
         """Create result should include the new record ID."""
-        import json
-
         result = {"id": 42}
 
-        formatted = json.dumps(result)
-        parsed = json.loads(formatted)
-
-        assert "id" in parsed
-        assert parsed["id"] == 42
+        assert "id" in result
+        assert result["id"] == 42
 
     def test_error_result_format(self):
         """Error results should have consistent format."""
-        import json
-
         error_result = {"error": "Access denied", "code": "ACCESS_ERROR"}
 
-        formatted = json.dumps(error_result)
-        parsed = json.loads(formatted)
-
-        assert "error" in parsed
-
-
-class TestToolArgumentValidation:
-    """Tests for tool argument validation."""
-
-    def test_model_name_validation(self):
-        """Model names should follow Odoo naming convention."""
-        valid_models = ["res.partner", "crm.lead", "hr.employee", "product.product"]
-        invalid_models = ["invalid", "no-dots", ""]
-
-        for model in valid_models:
-            assert "." in model
-            assert len(model.split(".")) >= 2
+        assert "error" in error_result
 
-        for model in invalid_models:
-            is_valid = "." in model and len(model.split(".")) >= 2
-            assert not is_valid
+    def test_structured_content_keeps_objects(self):
+        """JSON object results are exposed as structuredContent unchanged."""
+        result = [TextContent(type="text", text='{"id": 42}')]
 
-    def test_domain_format_validation(self):
-        """Domain should be a list of conditions."""
-        valid_domains = [
-            [],
-            [["name", "=", "test"]],
-            [["is_company", "=", True], ["active", "=", True]],
-            ["|", ["name", "ilike", "a"], ["name", "ilike", "b"]],
-        ]
+        assert structured_content(result) == {"id": 42}
 
-        for domain in valid_domains:
-            assert isinstance(domain, list)
+    def test_structured_content_wraps_lists(self):
+        """Non-object results are wrapped under a result key."""
+        result = [TextContent(type="text", text='[{"id": 1}, {"id": 2}]')]
 
-    def test_record_id_must_be_positive(self):
-        """Record IDs must be positive integers."""
-        valid_ids = [1, 42, 1000]
-        invalid_ids = [0, -1, -100]
+        assert structured_content(result) == {"result": [{"id": 1}, {"id": 2}]}
 
-        for rid in valid_ids:
-            assert rid > 0
+    def test_structured_content_ignores_plain_text(self):
+        """Non-JSON text results have no structured form."""
+        result = [TextContent(type="text", text="Record deleted")]
 
-        for rid in invalid_ids:
-            assert rid <= 0
+        assert structured_content(result) is None
 
-    def test_limit_bounds(self):
-        """Limit should be within reasonable bounds."""
-        min_limit = 1
-        max_limit = 1000
-        default_limit = 20
 
-        assert default_limit >= min_limit
-        assert default_limit <= max_limit
+class TestToolArgumentValidation:
+    """Tests for tool argument validation."""
 
-        # Test boundary
-        assert min_limit > 0
-        assert max_limit <= 10000  # Reasonable upper bound
+    @pytest.mark.parametrize("domain", VALID_DOMAINS)
+    def test_domain_format_validation(self, domain):
+        """Domain should be a list of conditions."""
+        assert isinstance(domain, list)
 
 
 class TestToolDescriptions:
-    """Tests for tool documentation."""
-
-    def test_all_tools_have_descriptions(self):
-        """All tools should have non-empty descriptions."""
-        tools = [
-            {"name": "search_records", "description": "Search for records..."},
-            {"name": "get_record", "description": "Get a single record..."},
-            {"name": "create_record", "description": "Create a new record..."},
-            {"name": "update_record", "description": "Update an existing record..."},
-            {"name": "delete_record", "description": "Delete a record..."},
-            {"name": "count_records", "description": "Count records..."},
-            {"name": "list_models", "description": "List available models..."},
-        ]
+    """Tests for tool documentation, one case per registered tool."""
 
-        for tool in tools:
-            assert tool["description"]
-            assert len(tool["description"]) > 10
+    @pytest.mark.parametrize("tool", ALL_TOOLS)
+    def test_tool_has_description(self, tool):
+        """Every tool should have a meaningful description."""
+        assert tool.description, f"Tool {tool.name} missing description"
+        assert len(tool.description) > 10, f"Tool {tool.name} has too short description"
 
-    def test_tool_names_are_snake_case(self):
+    @pytest.mark.parametrize("tool", ALL_TOOLS)
+    def test_tool_name_is_snake_case(self, tool):
         """Tool names should be in snake_case."""
-        tool_names = [
-            "search_records",
-            "get_record",
-            "create_record",
-            "update_record",
-            "delete_record",
-            "count_records",
-            "list_models",
-        ]
-
-        for name in tool_names:
-            assert name == name.lower()
-            assert " " not in name
-            assert "-" not in name
+        assert SNAKE_CASE.fullmatch(tool.name), f"Tool {tool.name} not snake_case"
 
 
 class TestEmployeeToolSchemas:
@@ -236,96 +255,31 @@ class TestEmployeeToolSchemas:
 
     def test_employee_tools_count(self):
         """Verify expected number of employee tools."""
-        from odoo_mcp_server.tools.employee import EMPLOYEE_TOOLS
-
         # 4 profile + 2 new profile + 5 leave + 1 new leave + 4 documents + 1 new document = 17
         assert len(EMPLOYEE_TOOLS) == 16
 
-    def test_get_direct_reports_schema(self):
-        """get_direct_reports should have no required fields."""
-        from odoo_mcp_server.tools.employee import EMPLOYEE_TOOLS
-
-        tool = next((t for t in EMPLOYEE_TOOLS if t.name == "get_direct_reports"), None)
-        assert tool is not None
-        assert tool.inputSchema["type"] == "object"
-        assert "required" not in tool.inputSchema or len(tool.inputSchema.get("required", [])) == 0
-
-    def test_update_my_contact_schema(self):
-        """update_my_contact should have optional phone and email fields."""
-        from odoo_mcp_server.tools.employee import EMPLOYEE_TOOLS
-
-        tool = next((t for t in EMPLOYEE_TOOLS if t.name == "update_my_contact"), None)
-        assert tool is not None
-        assert "work_phone" in tool.inputSchema["properties"]
-        assert "mobile_phone" in tool.inputSchema["properties"]
-        assert "work_email" in tool.inputSchema["properties"]
-        # All fields are optional
-        assert "required" not in tool.inputSchema or len(tool.inputSchema.get("required", [])) == 0
-
-    def test_get_public_holidays_schema(self):
-        """get_public_holidays should have optional year field."""
-        from odoo_mcp_server.tools.employee import EMPLOYEE_TOOLS
-
-        tool = next((t for t in EMPLOYEE_TOOLS if t.name == "get_public_holidays"), None)
-        assert tool is not None
-        assert "year" in tool.inputSchema["properties"]
-        assert tool.inputSchema["properties"]["year"]["type"] == "integer"
-
-    def test_get_document_details_schema(self):
-        """get_document_details should require document_id."""
-        from odoo_mcp_server.tools.employee import EMPLOYEE_TOOLS
-
-        tool = next((t for t in EMPLOYEE_TOOLS if t.name == "get_document_details"), None)
-        assert tool is not None
-        assert "document_id" in tool.inputSchema["properties"]
-        assert "document_id" in tool.inputSchema["required"]
-
-    def test_all_employee_tools_have_descriptions(self):
-        """All employee tools should have non-empty descriptions."""
-        from odoo_mcp_server.tools.employee import EMPLOYEE_TOOLS
-
-        for tool in EMPLOYEE_TOOLS:
-            assert tool.description, f"Tool {tool.name} missing description"
-            assert len(tool.description) > 10, f"Tool {tool.name} has too short description"
-
-    def test_employee_tool_names_are_snake_case(self):
-        """Employee tool names should be in snake_case."""
-        from odoo_mcp_server.tools.employee import EMPLOYEE_TOOLS
-
-        for tool in EMPLOYEE_TOOLS:
-            assert tool.name == tool.name.lower(), f"Tool {tool.name} not lowercase"
-            assert " " not in tool.name, f"Tool {tool.name} has spaces"
-            assert "-" not in tool.name, f"Tool {tool.name} has dashes"
+    @pytest.mark.parametrize(("tool_name", "expected_shape"), EMPLOYEE_SCHEMA_SHAPES)
+    def test_input_schema_shape(self, tool_name, expected_shape):
+        """Employee tool input schemas declare the expected fields and requirements."""
+        errors = [error.message for error in expected_shape.iter_errors(_EMPLOYEE_TOOLS_BY_NAME[tool_name].inputSchema)]
+        assert not errors, f"{tool_name}: {errors}"
 
 
 class TestEmployeeToolConfig:
     """Tests for employee tool configuration."""
 
-    def test_new_tools_have_scope_requirements(self):
+    @pytest.mark.parametrize("tool_name", NEW_EMPLOYEE_TOOLS)
+    def test_new_tool_has_scope_requirement(self, tool_name):
         """New tools should have scope requirements in config."""
-        from odoo_mcp_server.config import TOOL_SCOPE_REQUIREMENTS
-
-        new_tools = [
-            "get_direct_reports",
-            "update_my_contact",
-            "get_public_holidays",
-            "get_document_details",
-        ]
-
-        for tool_name in new_tools:
-            assert tool_name in TOOL_SCOPE_REQUIREMENTS, f"Missing scope for {tool_name}"
-            assert len(TOOL_SCOPE_REQUIREMENTS[tool_name]) > 0, f"Empty scope for {tool_name}"
+        assert tool_name in TOOL_SCOPE_REQUIREMENTS, f"Missing scope for {tool_name}"
+        assert TOOL_SCOPE_REQUIREMENTS[tool_name], f"Empty scope for {tool_name}"
 
     def test_update_my_contact_is_write_tool(self):
         """update_my_contact should be classified as a write tool."""
-        from odoo_mcp_server.config import WRITE_TOOLS
-
         assert "update_my_contact" in WRITE_TOOLS
 
     def test_new_profile_write_scope_exists(self):
         """odoo.hr.profile.write scope should be defined."""
-        from odoo_mcp_server.config import OAUTH_SCOPES
-
         assert "odoo.hr.profile.write" in OAUTH_SCOPES
 
 
@@ -334,32 +288,20 @@ class TestEmployeeFieldSecurity:
 
     def test_public_fields_defined(self):
         """Public employee fields should be defined."""
-        from odoo_mcp_server.tools.employee import PUBLIC_EMPLOYEE_FIELDS
-
-        assert "name" in PUBLIC_EMPLOYEE_FIELDS
-        assert "work_email" in PUBLIC_EMPLOYEE_FIELDS
-        assert "department_id" in PUBLIC_EMPLOYEE_FIELDS
+        missing = {"name", "work_email", "department_id"} - set(PUBLIC_EMPLOYEE_FIELDS)
+        assert not missing, f"Missing public fields: {missing}"
 
     def test_self_fields_include_public(self):
         """Self employee fields should include all public fields."""
-        from odoo_mcp_server.tools.employee import (
-            PUBLIC_EMPLOYEE_FIELDS,
-            SELF_EMPLOYEE_FIELDS,
-        )
-
-        for field in PUBLIC_EMPLOYEE_FIELDS:
-            assert field in SELF_EMPLOYEE_FIELDS
+        missing = set(PUBLIC_EMPLOYEE_FIELDS) - set(SELF_EMPLOYEE_FIELDS)
+        assert not missing, f"Missing self fields: {missing}"
 
     def test_restricted_folders_defined(self):
         """DMS restricted folders should be defined."""
-        from odoo_mcp_server.tools.employee import DMS_RESTRICTED_FOLDERS
-
-        assert "Background Checks" in DMS_RESTRICTED_FOLDERS
-        assert "Offboarding Documents" in DMS_RESTRICTED_FOLDERS
+        missing = {"Background Checks", "Offboarding Documents"} - set(DMS_RESTRICTED_FOLDERS)
+        assert not missing, f"Missing restricted folders: {missing}"
 
     def test_allowed_folders_defined(self):
         """DMS allowed folders should be defined."""
-        from odoo_mcp_server.tools.employee import DMS_ALLOWED_FOLDERS
-
-        assert "Contracts" in DMS_ALLOWED_FOLDERS
-        assert "Identity" in DMS_ALLOWED_FOLDERS
+        missing = {"Contracts", "Identity"} - set(DMS_ALLOWED_FOLDERS)
+        assert not missing, f"Missing allowed folders: {missing}"